@@ -5,7 +5,7 @@ Sprint 3: IntakeAgent extracts candidate signals from unstructured documents.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -184,12 +184,19 @@ PACK_SIGNAL_TYPES = {
     "wealth": WEALTH_SIGNAL_TYPES,
 }
 
+# Set views of the lists above for membership checks (the lists keep their
+# order for prompts)
+_PACK_SIGNAL_TYPE_NAMES: Dict[str, FrozenSet[str]] = {
+    pack: frozenset(signal_types) for pack, signal_types in PACK_SIGNAL_TYPES.items()
+}
+
 
 def validate_signal_type_for_pack(signal_type: str, pack: str) -> bool:
     """Check if a signal type is valid for a pack."""
-    if pack not in PACK_SIGNAL_TYPES:
+    names = _PACK_SIGNAL_TYPE_NAMES.get(pack)
+    if names is None:
         return False
-    return signal_type in PACK_SIGNAL_TYPES[pack]
+    return signal_type in names
 
 
 def get_valid_signal_types(pack: str) -> List[str]:
@@ -5,11 +5,12 @@ All narrative outputs are structured and validated to ensure
 proper grounding to evidence.
 """
 
+import sys
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class MemoLength(str, Enum):
@@ -37,7 +38,16 @@ class MemoTemplate(str, Enum):
 
 
 class MemoTemplateConfig(BaseModel):
-    """Configuration for a memo template."""
+    """
+    Configuration for a memo template.
+
+    Frozen: pack template configs are built once and shared (including
+    through lru_cache'd lookups), so they must not be mutated in place.
+    Hashing uses template_id only; equal configs share a template_id, and
+    the dict-valued length_guidelines would make a field-wise hash fail.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     template_id: MemoTemplate = Field(..., description="Template identifier")
     name: str = Field(..., description="Human-readable template name")
@@ -45,8 +55,8 @@ class MemoTemplateConfig(BaseModel):
     pack: Optional[str] = Field(default=None, description="Pack this template belongs to (treasury/wealth/None for generic)")
 
     # Structure configuration
-    required_sections: List[str] = Field(
-        default_factory=list,
+    required_sections: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Section headings that must be present"
     )
     max_sections: int = Field(default=5, description="Maximum number of sections")
@@ -62,15 +72,25 @@ class MemoTemplateConfig(BaseModel):
     )
 
     # Content guidance
-    focus_areas: List[str] = Field(
-        default_factory=list,
+    focus_areas: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Key areas to emphasize in this template"
     )
-    vocabulary_hints: List[str] = Field(
-        default_factory=list,
+    vocabulary_hints: Tuple[str, ...] = Field(
+        default_factory=tuple,
         description="Domain-specific terms to use"
     )
 
+    def __hash__(self) -> int:
+        """Hash by template_id."""
+        return hash(self.template_id)
+
+    @field_validator("required_sections", "focus_areas", "vocabulary_hints")
+    @classmethod
+    def intern_strings(cls, v: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Intern template strings so they are shared across loaded templates."""
+        return tuple(sys.intern(item) for item in v)
+
 
 class EvidenceReference(BaseModel):
     """Reference to a piece of evidence supporting a claim."""
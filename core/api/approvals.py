@@ -12,8 +12,8 @@ Safety invariants:
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import func, case
-from typing import Optional
-from uuid import UUID
+from typing import List, Optional
+from uuid import UUID, uuid4
 
 from core.database import get_db
 from core.models import (
@@ -21,10 +21,10 @@ from core.models import (
     AuditEvent, AuditEventType,
     Signal, SignalReliability
 )
-from core.models.signal import compute_signal_content_hash
+from core.models.signal import bulk_create_signals, compute_signal_content_hash
 from core.schemas.approval import (
     ApprovalCreate, ApprovalResponse, ApprovalListResponse,
-    ApprovalApproveRequest, ApprovalRejectRequest
+    ApprovalApproveRequest, ApprovalBatchApproveRequest, ApprovalRejectRequest
 )
 
 router = APIRouter(prefix="/approvals", tags=["approvals"])
@@ -130,43 +130,59 @@ def approve_approval(
             detail=f"Approval already {approval.status.value}"
         )
 
-    # Execute the approved action based on type
-    result_id = None
+    result_id = _execute_approval(approval, db)
+    _mark_approved(approval, reviewed_by, result_id, request.notes, db)
 
-    if approval.action_type == ApprovalActionType.SIGNAL:
-        result_id = _execute_signal_approval(approval, db)
-    elif approval.action_type == ApprovalActionType.CONTEXT:
-        # Context additions are additive-only, no separate entity created
-        _execute_context_approval(approval, db)
-    elif approval.action_type == ApprovalActionType.DISMISS:
-        _execute_dismiss_approval(approval, db)
-    elif approval.action_type == ApprovalActionType.POLICY_DRAFT:
-        result_id = _execute_policy_draft_approval(approval, db)
-    # Decision type requires special handling (human must still make the decision)
+    db.commit()
+    db.refresh(approval)
 
-    # Mark as approved
-    approval.approve(reviewed_by=reviewed_by, result_id=result_id, notes=request.notes)
+    return _approval_to_response(approval)
 
-    # Create audit event
-    audit_event = AuditEvent(
-        event_type=AuditEventType.APPROVAL_APPROVED,
-        aggregate_type="approval",
-        aggregate_id=approval.id,
-        event_data={
-            "action": "approved",
-            "action_type": approval.action_type.value,
-            "proposed_by": approval.proposed_by,
-            "result_id": str(result_id) if result_id else None,
-            "notes": request.notes
-        },
-        actor=reviewed_by
-    )
-    db.add(audit_event)
+
+@router.post("/approve-batch", response_model=List[ApprovalResponse])
+def approve_approvals_batch(
+    request: ApprovalBatchApproveRequest,
+    reviewed_by: str = Query(..., description="User approving the actions"),
+    db: Session = Depends(get_db)
+):
+    """
+    Approve several agent-proposed actions in one transaction.
+
+    Pending signal proposals are inserted with a single bulk INSERT
+    instead of one round-trip per approval. Either every approval in
+    the batch is applied or none are.
+    """
+    approval_ids = list(dict.fromkeys(request.approval_ids))
+    approvals = db.query(ApprovalQueue).filter(ApprovalQueue.id.in_(approval_ids)).all()
+    by_id = {approval.id: approval for approval in approvals}
+
+    missing = [str(approval_id) for approval_id in approval_ids if approval_id not in by_id]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Approvals not found: {', '.join(missing)}")
+
+    approvals = [by_id[approval_id] for approval_id in approval_ids]
+    for approval in approvals:
+        if approval.status != ApprovalStatus.PENDING:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Approval {approval.id} already {approval.status.value}"
+            )
+
+    signal_approvals = [a for a in approvals if a.action_type == ApprovalActionType.SIGNAL]
+    result_ids = {}
+    if len(signal_approvals) > 1:
+        result_ids = _execute_signal_approvals_batch(signal_approvals, db)
+
+    for approval in approvals:
+        if approval.id in result_ids:
+            result_id = result_ids[approval.id]
+        else:
+            result_id = _execute_approval(approval, db)
+        _mark_approved(approval, reviewed_by, result_id, request.notes, db)
 
     db.commit()
-    db.refresh(approval)
 
-    return _approval_to_response(approval)
+    return [_approval_to_response(approval) for approval in approvals]
 
 
 @router.post("/{approval_id}/reject", response_model=ApprovalResponse)
@@ -275,8 +291,52 @@ def _approval_to_response(approval: ApprovalQueue) -> ApprovalResponse:
     )
 
 
-def _execute_signal_approval(approval: ApprovalQueue, db: Session) -> UUID:
-    """Create signal from approved proposal."""
+def _execute_approval(approval: ApprovalQueue, db: Session) -> Optional[UUID]:
+    """Execute the approved action based on type."""
+    result_id = None
+
+    if approval.action_type == ApprovalActionType.SIGNAL:
+        result_id = _execute_signal_approval(approval, db)
+    elif approval.action_type == ApprovalActionType.CONTEXT:
+        # Context additions are additive-only, no separate entity created
+        _execute_context_approval(approval, db)
+    elif approval.action_type == ApprovalActionType.DISMISS:
+        _execute_dismiss_approval(approval, db)
+    elif approval.action_type == ApprovalActionType.POLICY_DRAFT:
+        result_id = _execute_policy_draft_approval(approval, db)
+    # Decision type requires special handling (human must still make the decision)
+
+    return result_id
+
+
+def _mark_approved(
+    approval: ApprovalQueue,
+    reviewed_by: str,
+    result_id: Optional[UUID],
+    notes: Optional[str],
+    db: Session
+):
+    """Mark approval as approved and log the audit event."""
+    approval.approve(reviewed_by=reviewed_by, result_id=result_id, notes=notes)
+
+    audit_event = AuditEvent(
+        event_type=AuditEventType.APPROVAL_APPROVED,
+        aggregate_type="approval",
+        aggregate_id=approval.id,
+        event_data={
+            "action": "approved",
+            "action_type": approval.action_type.value,
+            "proposed_by": approval.proposed_by,
+            "result_id": str(result_id) if result_id else None,
+            "notes": notes
+        },
+        actor=reviewed_by
+    )
+    db.add(audit_event)
+
+
+def _signal_values_from_approval(approval: ApprovalQueue) -> dict:
+    """Build signal column values (including content_hash) from a proposal."""
     payload = approval.payload
 
     # Map reliability string to enum
@@ -302,50 +362,96 @@ def _execute_signal_approval(approval: ApprovalQueue, db: Session) -> UUID:
         observed_at=observed_at
     )
 
-    # Check for duplicate
-    existing = db.query(Signal).filter(Signal.content_hash == content_hash).first()
-    if existing:
-        return existing.id
-
-    # Create signal
-    signal = Signal(
-        pack=payload["pack"],
-        signal_type=payload["signal_type"],
-        payload=payload["payload"],
-        source=payload["source"],
-        reliability=reliability,
-        observed_at=observed_at,
-        signal_metadata={
+    return {
+        "pack": payload["pack"],
+        "signal_type": payload["signal_type"],
+        "payload": payload["payload"],
+        "source": payload["source"],
+        "reliability": reliability,
+        "observed_at": observed_at,
+        "signal_metadata": {
             "extracted_by": approval.proposed_by,
             "source_spans": payload.get("source_spans", []),
             "extraction_notes": payload.get("extraction_notes"),
             "confidence": approval.confidence
         },
-        content_hash=content_hash
-    )
+        "content_hash": content_hash
+    }
 
-    db.add(signal)
-    db.flush()
 
-    # Create audit event for signal creation
-    audit_event = AuditEvent(
+def _signal_received_event(signal_id: UUID, values: dict, approval: ApprovalQueue) -> AuditEvent:
+    """Audit event for a signal created from an approved proposal."""
+    return AuditEvent(
         event_type=AuditEventType.SIGNAL_RECEIVED,
         aggregate_type="signal",
-        aggregate_id=signal.id,
+        aggregate_id=signal_id,
         event_data={
-            "signal_type": signal.signal_type,
-            "source": signal.source,
-            "pack": signal.pack,
+            "signal_type": values["signal_type"],
+            "source": values["source"],
+            "pack": values["pack"],
             "extracted_by": approval.proposed_by,
             "approval_id": str(approval.id)
         },
         actor="system"
     )
-    db.add(audit_event)
+
+
+def _execute_signal_approval(approval: ApprovalQueue, db: Session) -> UUID:
+    """Create signal from approved proposal."""
+    values = _signal_values_from_approval(approval)
+
+    # Check for duplicate
+    existing = db.query(Signal).filter(Signal.content_hash == values["content_hash"]).first()
+    if existing:
+        return existing.id
+
+    # Create signal
+    signal = Signal(**values)
+
+    db.add(signal)
+    db.flush()
+
+    # Create audit event for signal creation
+    db.add(_signal_received_event(signal.id, values, approval))
 
     return signal.id
 
 
+def _execute_signal_approvals_batch(approvals: List[ApprovalQueue], db: Session) -> dict:
+    """
+    Create signals for several approved proposals with one bulk INSERT.
+
+    Duplicates (already stored, or repeated within the batch) resolve to
+    the existing signal id, matching the single-approval path.
+
+    Returns:
+        Mapping of approval id to the resulting signal id
+    """
+    values_by_approval = [(a, _signal_values_from_approval(a)) for a in approvals]
+    hashes = {values["content_hash"] for _, values in values_by_approval}
+    signal_ids = dict(
+        db.query(Signal.content_hash, Signal.id).filter(Signal.content_hash.in_(hashes)).all()
+    )
+
+    rows = []
+    result_ids = {}
+    for approval, values in values_by_approval:
+        content_hash = values["content_hash"]
+        if content_hash not in signal_ids:
+            signal_id = uuid4()
+            signal_ids[content_hash] = signal_id
+            row = dict(values, id=signal_id)
+            # Core INSERT is keyed by column name, not ORM attribute
+            row["metadata"] = row.pop("signal_metadata")
+            rows.append(row)
+            db.add(_signal_received_event(signal_id, values, approval))
+        result_ids[approval.id] = signal_ids[content_hash]
+
+    bulk_create_signals(rows, db=db)
+
+    return result_ids
+
+
 def _execute_context_approval(approval: ApprovalQueue, db: Session):
     """Add context to exception from approved proposal."""
     from core.models import Exception as DBException
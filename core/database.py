@@ -12,6 +12,7 @@ from core.config import settings
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,  # Verify connections before using
+    insertmanyvalues_page_size=1000,  # Rows per multi-VALUES INSERT batch
     echo=settings.log_level == "DEBUG"
 )
 
@@ -7,6 +7,7 @@ policy rules to signals and produces structured evaluation results.
 CRITICAL: All evaluation logic must be deterministic.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Any, Tuple
 from enum import Enum
 
@@ -152,6 +153,17 @@ def _check_threshold(signal: Dict[str, Any], threshold: Dict[str, Any]) -> bool:
     return _compare_values(field_value, operator, comparison_value)
 
 
+@lru_cache(maxsize=1024)
+def _split_field_path(field_path: str) -> Tuple[str, ...]:
+    """
+    Split a dotted field path once per distinct path.
+
+    Rule definitions reuse a handful of paths across every signal, so
+    the split is cached instead of repeated per evaluation.
+    """
+    return tuple(field_path.split("."))
+
+
 def _extract_field_value(data: Dict[str, Any], field_path: str) -> Any:
     """
     Extract nested field value from dictionary using dot notation.
@@ -161,10 +173,9 @@ def _extract_field_value(data: Dict[str, Any], field_path: str) -> Any:
         >>> _extract_field_value(data, "payload.current_position")
         120
     """
-    parts = field_path.split(".")
     current = data
 
-    for part in parts:
+    for part in _split_field_path(field_path):
         if isinstance(current, dict) and part in current:
             current = current[part]
         else:
@@ -11,7 +11,7 @@ from uuid import uuid4
 
 from sqlalchemy import (
     Column, String, Text, DateTime, Integer, ForeignKey, CheckConstraint,
-    UniqueConstraint, Enum as SQLEnum
+    UniqueConstraint, Enum as SQLEnum, and_
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -45,6 +45,18 @@ class Policy(Base):
 
     # Relationships
     versions = relationship("PolicyVersion", back_populates="policy", cascade="all, delete-orphan")
+    # Read-only view of the active, open-ended version (valid_to IS NULL).
+    # Lets callers fetch a policy and its current version in one joined query.
+    current_version = relationship(
+        "PolicyVersion",
+        primaryjoin=lambda: and_(
+            PolicyVersion.policy_id == Policy.id,
+            PolicyVersion.status == PolicyStatus.ACTIVE,
+            PolicyVersion.valid_to.is_(None),
+        ),
+        uselist=False,
+        viewonly=True,
+    )
 
     __table_args__ = (
         UniqueConstraint("name", "pack", name="uq_policy_name_pack"),
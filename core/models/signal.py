@@ -9,6 +9,7 @@ import hashlib
 import json
 from datetime import datetime
 from enum import Enum as PyEnum
+from typing import Any, Dict, List
 from uuid import uuid4
 
 from sqlalchemy import (
@@ -85,9 +86,34 @@ class Signal(Base):
         CheckConstraint("observed_at <= ingested_at", name="ck_signal_observed_before_ingested"),
         Index("idx_signals_type_time", "pack", "signal_type", "observed_at"),
         Index("idx_signals_ingested", "ingested_at"),
+        # Keyset pagination for recent-signal reads filtered by type/source
+        Index("idx_signals_type_source_time", "signal_type", "source", observed_at.desc(), id.desc()),
         # Unique constraint: same content cannot be ingested twice
         UniqueConstraint("content_hash", name="uq_signal_content_hash"),
     )
 
     def __repr__(self):
         return f"<Signal(id={self.id}, type='{self.signal_type}', pack='{self.pack}', observed_at={self.observed_at})>"
+
+
+def bulk_create_signals(rows: List[Dict[str, Any]], db) -> int:
+    """
+    Insert many signal rows with a single executemany INSERT.
+
+    Rows are keyed by ``signals`` table column names (so ``metadata``,
+    not ``signal_metadata``) and must all share the same keys. SQLAlchemy
+    batches them into multi-VALUES statements of up to
+    ``insertmanyvalues_page_size`` rows. The caller owns the transaction.
+
+    Args:
+        rows: Signal rows to insert
+        db: Session to execute on
+
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+
+    db.execute(Signal.__table__.insert(), rows)
+    return len(rows)
@@ -58,6 +58,11 @@ class ApprovalApproveRequest(ApprovalReviewRequest):
     pass
 
 
+class ApprovalBatchApproveRequest(ApprovalReviewRequest):
+    """Schema for approving several approvals at once."""
+    approval_ids: List[UUID] = Field(..., min_length=1, description="Approvals to approve")
+
+
 class ApprovalRejectRequest(ApprovalReviewRequest):
     """Schema for rejecting an approval."""
     reason: Optional[str] = Field(None, description="Reason for rejection")
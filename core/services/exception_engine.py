@@ -297,15 +297,15 @@ class ExceptionEngine:
             # Use the first matched signal type to find options
             for signal in matched_signals:
                 signal_type = signal.get("type")
-                if signal_type and signal_type in pack_templates:
-                    options = pack_templates[signal_type]
+                options = pack_templates.get(signal_type) if signal_type else None
+                if options is not None:
                     # Ensure each option has an id (some templates may be missing it)
                     return self._ensure_option_ids(options, signal_type)
 
         # Try rule type as fallback
         rule_type = policy_version.rule_definition.get("type", "unknown")
-        if rule_type in pack_templates:
-            options = pack_templates[rule_type]
+        options = pack_templates.get(rule_type)
+        if options is not None:
             return self._ensure_option_ids(options, rule_type)
 
         # Default options if no template found
@@ -0,0 +1,170 @@
+"""
+Tests for POST /approvals/approve-batch.
+
+Signal proposals in a batch are inserted with one bulk INSERT; the whole
+batch commits or rolls back together.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from core.config import settings
+from core.database import get_db
+from core.main import app
+from core.models import Policy, PolicyVersion, Signal, SignalReliability
+from core.models.approval import ApprovalQueue, ApprovalActionType, ApprovalStatus
+from core.models.signal import compute_signal_content_hash
+
+
+BATCH_URL = f"{settings.api_v1_prefix}/approvals/approve-batch"
+OBSERVED_AT = (datetime.utcnow() - timedelta(hours=1)).replace(microsecond=0)
+
+
+@pytest.fixture
+def client(db_engine):
+    """API client whose requests get their own session, like get_db."""
+    Session = sessionmaker(bind=db_engine)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+
+
+def _signal_payload(asset: str) -> dict:
+    return {
+        "pack": "treasury",
+        "signal_type": "position_limit_breach",
+        "payload": {"asset": asset, "current_position": 120, "limit": 100},
+        "source": "email/inbox/test_123",
+        "observed_at": OBSERVED_AT.isoformat(),
+    }
+
+
+def _signal_approval(asset: str, **kwargs) -> ApprovalQueue:
+    return ApprovalQueue(
+        action_type=ApprovalActionType.SIGNAL,
+        payload=_signal_payload(asset),
+        proposed_by="intake_agent",
+        confidence=0.9,
+        **kwargs,
+    )
+
+
+def _approve(client, approvals):
+    return client.post(
+        BATCH_URL,
+        params={"reviewed_by": "reviewer"},
+        json={"approval_ids": [str(a.id) for a in approvals]},
+    )
+
+
+class TestApproveBatch:
+    """Endpoint tests for batch approval."""
+
+    def test_signals_created_once_per_approval(self, client, db_session):
+        """Each pending signal proposal yields its own signal."""
+        approvals = [_signal_approval("BTC"), _signal_approval("ETH")]
+        db_session.add_all(approvals)
+        db_session.commit()
+
+        response = _approve(client, approvals)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["status"] for item in body] == ["approved", "approved"]
+        assert body[0]["result_id"] != body[1]["result_id"]
+        assert db_session.query(Signal).count() == 2
+
+    def test_existing_hash_reuses_signal(self, client, db_session):
+        """A proposal matching a stored signal resolves to that signal."""
+        payload = _signal_payload("BTC")
+        existing = Signal(
+            pack=payload["pack"],
+            signal_type=payload["signal_type"],
+            payload=payload["payload"],
+            source=payload["source"],
+            reliability=SignalReliability.MEDIUM,
+            observed_at=OBSERVED_AT,
+            content_hash=compute_signal_content_hash(
+                pack=payload["pack"],
+                signal_type=payload["signal_type"],
+                payload=payload["payload"],
+                source=payload["source"],
+                observed_at=OBSERVED_AT,
+            ),
+        )
+        approvals = [_signal_approval("BTC"), _signal_approval("ETH")]
+        db_session.add(existing)
+        db_session.add_all(approvals)
+        db_session.commit()
+
+        response = _approve(client, approvals)
+
+        assert response.status_code == 200
+        assert response.json()[0]["result_id"] == str(existing.id)
+        assert db_session.query(Signal).count() == 2
+
+    def test_hash_repeated_within_batch(self, client, db_session):
+        """Identical proposals in one batch share a single new signal."""
+        approvals = [_signal_approval("BTC"), _signal_approval("BTC"), _signal_approval("ETH")]
+        db_session.add_all(approvals)
+        db_session.commit()
+
+        response = _approve(client, approvals)
+
+        assert response.status_code == 200
+        result_ids = [item["result_id"] for item in response.json()]
+        assert result_ids[0] == result_ids[1]
+        assert result_ids[2] != result_ids[0]
+        assert db_session.query(Signal).count() == 2
+
+    def test_mixed_action_types(self, client, db_session):
+        """Non-signal approvals in the batch go through their own handlers."""
+        draft = ApprovalQueue(
+            action_type=ApprovalActionType.POLICY_DRAFT,
+            payload={
+                "pack": "treasury",
+                "name": "Drafted Policy",
+                "description": "Drafted by agent",
+                "rule_definition": {"type": "threshold_breach", "conditions": []},
+            },
+            proposed_by="policy_draft_agent",
+        )
+        approvals = [_signal_approval("BTC"), draft, _signal_approval("ETH")]
+        db_session.add_all(approvals)
+        db_session.commit()
+
+        response = _approve(client, approvals)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [item["action_type"] for item in body] == ["signal", "policy_draft", "signal"]
+        assert db_session.query(Signal).count() == 2
+        version = db_session.query(PolicyVersion).filter(
+            PolicyVersion.id == body[1]["result_id"]
+        ).one()
+        assert db_session.query(Policy).filter(Policy.id == version.policy_id).one().name == "Drafted Policy"
+
+    def test_non_pending_approval_rolls_back_batch(self, client, db_session):
+        """One already-reviewed approval leaves the whole batch untouched."""
+        approved = _signal_approval("SOL")
+        approved.approve(reviewed_by="someone_else")
+        approvals = [_signal_approval("BTC"), _signal_approval("ETH"), approved]
+        db_session.add_all(approvals)
+        db_session.commit()
+
+        response = _approve(client, approvals)
+
+        assert response.status_code == 400
+        db_session.expire_all()
+        assert db_session.query(Signal).count() == 0
+        assert [a.status for a in approvals[:2]] == [ApprovalStatus.PENDING, ApprovalStatus.PENDING]
@@ -314,3 +314,11 @@ class TestSignalTypeValidation:
 
         unknown_types = get_valid_signal_types("unknown")
         assert unknown_types == []
+
+    def test_membership_sets_match_lists(self):
+        """Test that the set views used for validation mirror the ordered lists."""
+        from coprocessor.schemas.extraction import PACK_SIGNAL_TYPES, _PACK_SIGNAL_TYPE_NAMES
+
+        assert set(_PACK_SIGNAL_TYPE_NAMES) == set(PACK_SIGNAL_TYPES)
+        for pack, signal_types in PACK_SIGNAL_TYPES.items():
+            assert _PACK_SIGNAL_TYPE_NAMES[pack] == frozenset(signal_types)
@@ -7,6 +7,8 @@ before entering the deterministic kernel.
 
 from typing import Any, Dict, List, Optional, Tuple
 
+from pydantic_core import SchemaError, SchemaValidator, ValidationError as PydanticValidationError, core_schema
+
 
 class ValidationError(Exception):
     """Raised when signal validation fails."""
@@ -25,6 +27,41 @@ TYPE_VALIDATORS = {
     "object": lambda v: isinstance(v, dict),
 }
 
+# Compiled (pydantic-core) equivalents of TYPE_VALIDATORS. Strict mode
+# matches the isinstance checks above, including bool not being a number.
+_CORE_TYPE_SCHEMAS = {
+    "string": core_schema.str_schema(strict=True),
+    "number": core_schema.union_schema([
+        core_schema.int_schema(strict=True),
+        core_schema.float_schema(strict=True),
+    ]),
+    "boolean": core_schema.bool_schema(strict=True),
+    "array": core_schema.list_schema(strict=True),
+    "object": core_schema.dict_schema(strict=True),
+}
+
+
+def _compile_payload_schema(schema: Dict[str, str]) -> Optional[SchemaValidator]:
+    """
+    Compile a pack payload_schema into a pydantic-core validator.
+
+    The compiled validator only answers "is this payload valid"; error
+    details still come from SignalValidator._validate_payload. Returns
+    None if the schema uses a type with no compiled equivalent.
+    """
+    if not all(field_type in _CORE_TYPE_SCHEMAS for field_type in schema.values()):
+        return None
+    try:
+        return SchemaValidator(core_schema.typed_dict_schema(
+            {
+                field_name: core_schema.typed_dict_field(_CORE_TYPE_SCHEMAS[field_type])
+                for field_name, field_type in schema.items()
+            },
+            extra_behavior="ignore",
+        ))
+    except SchemaError:
+        return None
+
 
 class SignalValidator:
     """Validates signals against pack-defined schemas."""
@@ -32,6 +69,7 @@ class SignalValidator:
     def __init__(self):
         """Initialize validator with pack signal type definitions."""
         self._pack_schemas: Dict[str, Dict[str, Any]] = {}
+        self._payload_validators: Dict[Tuple[str, str], Optional[SchemaValidator]] = {}
         self._load_pack_schemas()
 
     def _load_pack_schemas(self):
@@ -102,12 +140,43 @@ class SignalValidator:
         signal_def = pack_types[signal_type]
         payload_schema = signal_def.get("payload_schema", {})
 
+        # Fast path: compiled validator accepts the payload
+        if self._is_valid_payload(pack, signal_type, payload, payload_schema):
+            return True, errors
+
         # Validate payload against schema
         payload_errors = self._validate_payload(payload, payload_schema)
         errors.extend(payload_errors)
 
         return len(errors) == 0, errors
 
+    def _is_valid_payload(
+        self,
+        pack: str,
+        signal_type: str,
+        payload: Any,
+        schema: Dict[str, str]
+    ) -> bool:
+        """
+        Check a payload with the compiled validator for its signal type.
+
+        Validators are compiled on first use per (pack, signal_type).
+        False means "not known valid" and the caller falls back to
+        _validate_payload for the detailed errors.
+        """
+        key = (pack, signal_type)
+        if key not in self._payload_validators:
+            self._payload_validators[key] = _compile_payload_schema(schema)
+
+        validator = self._payload_validators[key]
+        if validator is None:
+            return False
+        try:
+            validator.validate_python(payload)
+        except PydanticValidationError:
+            return False
+        return True
+
     def _validate_payload(
         self,
         payload: Dict[str, Any],
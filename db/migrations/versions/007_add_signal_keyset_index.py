@@ -0,0 +1,30 @@
+"""Add composite index for keyset pagination of recent signals
+
+Revision ID: 007_signal_keyset
+Revises: 006
+Create Date: 2026-10-16
+
+Supports get_recent_signals filtered by signal_type/source and paged by
+(observed_at, id) descending without a sort over the candidate set.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007_signal_keyset'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_signals_type_source_time',
+        'signals',
+        ['signal_type', 'source', sa.text('observed_at DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_signals_type_source_time', table_name='signals')
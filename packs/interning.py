@@ -0,0 +1,47 @@
+"""
+String interning for pack templates.
+
+Template tables repeat the same short strings (signal types, field paths,
+implication phrases) many times and across packs. Interning them at build
+time collapses duplicates to one object and lets dict lookups keyed by
+them hit CPython's identity fast path.
+"""
+
+import sys
+from typing import Any
+
+_intern = sys.intern
+
+
+def intern_tree(obj: Any) -> Any:
+    """
+    Return a copy of obj with every str (including dict keys) interned.
+
+    Dicts, lists and tuples are rebuilt with the same container type;
+    any other value, including str subclasses, is returned unchanged.
+    """
+    # Exact-type checks first: template tables are plain str/dict/tuple/list,
+    # and this pass dominates template build time.
+    cls = type(obj)
+    if cls is str:
+        return _intern(obj)
+    if cls is dict:
+        return {
+            (_intern(key) if type(key) is str else intern_tree(key)): intern_tree(value)
+            for key, value in obj.items()
+        }
+    if cls is tuple:
+        return tuple([intern_tree(item) for item in obj])
+    if cls is list:
+        return [intern_tree(item) for item in obj]
+
+    if isinstance(obj, str):
+        # sys.intern rejects str subclasses (e.g. str enums); keep them as-is
+        return obj
+    if isinstance(obj, dict):
+        return {intern_tree(key): intern_tree(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [intern_tree(item) for item in obj]
+    if isinstance(obj, tuple):
+        return tuple(intern_tree(item) for item in obj)
+    return obj
@@ -0,0 +1,32 @@
+"""
+Specialized dict projections for pack templates.
+
+Fingerprint extraction picks a fixed handful of payload keys per signal
+type. compile_projection() turns such a key tuple into a function whose
+body is a single dict display, e.g.
+
+    def project(payload):
+        return {"client_id": payload.get("client_id"), ...}
+
+so the per-call work is the key lookups alone, with no loop over the
+field tuple.
+"""
+
+from typing import Any, Callable, Dict, Sequence
+
+Projection = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+def compile_projection(fields: Sequence[str]) -> Projection:
+    """
+    Compile a function returning {field: payload.get(field)} for fields.
+
+    Fields must be strings; they are embedded as literals via repr().
+    """
+    if not all(isinstance(field, str) for field in fields):
+        raise TypeError("projection fields must be strings")
+
+    items = ", ".join(f"{field!r}: payload.get({field!r})" for field in fields)
+    namespace: Dict[str, Any] = {}
+    exec(f"def project(payload):\n    return {{{items}}}\n", namespace)
+    return namespace["project"]
@@ -5,7 +5,40 @@ Extracts key dimensions from signals for exception fingerprinting.
 These dimensions determine whether two exceptions are "the same" for deduplication.
 """
 
-from typing import Dict, Any
+from __future__ import annotations
+
+from typing import Dict, Any, Tuple
+
+from packs.projection import Projection, compile_projection
+
+
+# Key dimension fields by signal type. Missing payload fields map to None.
+FIELDS: Dict[str, Tuple[str, ...]] = {
+    # Position limit breach: dedupe by asset
+    "position_limit_breach": ("asset",),
+    # Market volatility: dedupe by asset
+    "market_volatility_spike": ("asset",),
+    # Counterparty downgrade: dedupe by counterparty
+    "counterparty_credit_downgrade": ("counterparty",),
+    # Liquidity breach: dedupe by asset
+    "liquidity_threshold_breach": ("asset",),
+    # FX exposure breach: dedupe by currency pair and direction
+    "fx_exposure_breach": ("currency_pair", "direction"),
+    # Cash forecast variance: dedupe by account
+    "cash_forecast_variance": ("account",),
+    # Covenant breach: dedupe by covenant name and facility
+    "covenant_breach": ("covenant_name", "facility"),
+    # Settlement failure: dedupe by trade ID
+    "settlement_failure": ("trade_id",),
+}
+
+# Default: use asset if available, otherwise empty (absent fields are omitted)
+DEFAULT_FIELDS: Tuple[str, ...] = ("asset",)
+
+# One specialized extractor per signal type, generated from FIELDS
+_EXTRACTORS: Dict[str, Projection] = {
+    signal_type: compile_projection(fields) for signal_type, fields in FIELDS.items()
+}
 
 
 def extract_key_dimensions(signal_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -19,83 +52,8 @@ def extract_key_dimensions(signal_type: str, payload: Dict[str, Any]) -> Dict[st
     Returns:
         Key dimensions dictionary for fingerprint computation
     """
-    extractor = EXTRACTORS.get(signal_type, _default_extractor)
+    extractor = _EXTRACTORS.get(signal_type)
+    if extractor is None:
+        return {k: payload[k] for k in DEFAULT_FIELDS if k in payload}
     return extractor(payload)
 
-
-def _position_limit_breach(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Position limit breach: dedupe by asset."""
-    return {
-        "asset": payload.get("asset"),
-    }
-
-
-def _market_volatility_spike(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Market volatility: dedupe by asset."""
-    return {
-        "asset": payload.get("asset"),
-    }
-
-
-def _counterparty_credit_downgrade(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Counterparty downgrade: dedupe by counterparty."""
-    return {
-        "counterparty": payload.get("counterparty"),
-    }
-
-
-def _liquidity_threshold_breach(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Liquidity breach: dedupe by asset."""
-    return {
-        "asset": payload.get("asset"),
-    }
-
-
-def _fx_exposure_breach(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """FX exposure breach: dedupe by currency pair and direction."""
-    return {
-        "currency_pair": payload.get("currency_pair"),
-        "direction": payload.get("direction"),
-    }
-
-
-def _cash_forecast_variance(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Cash forecast variance: dedupe by account."""
-    return {
-        "account": payload.get("account"),
-    }
-
-
-def _covenant_breach(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Covenant breach: dedupe by covenant name and facility."""
-    return {
-        "covenant_name": payload.get("covenant_name"),
-        "facility": payload.get("facility"),
-    }
-
-
-def _settlement_failure(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Settlement failure: dedupe by trade ID."""
-    return {
-        "trade_id": payload.get("trade_id"),
-    }
-
-
-def _default_extractor(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Default: use asset if available, otherwise empty."""
-    if "asset" in payload:
-        return {"asset": payload["asset"]}
-    return {}
-
-
-# Registry of extractors by signal type
-EXTRACTORS = {
-    "position_limit_breach": _position_limit_breach,
-    "market_volatility_spike": _market_volatility_spike,
-    "counterparty_credit_downgrade": _counterparty_credit_downgrade,
-    "liquidity_threshold_breach": _liquidity_threshold_breach,
-    "fx_exposure_breach": _fx_exposure_breach,
-    "cash_forecast_variance": _cash_forecast_variance,
-    "covenant_breach": _covenant_breach,
-    "settlement_failure": _settlement_failure,
-}
@@ -2,15 +2,63 @@
 Treasury Pack - Policy Templates.
 
 Defines reusable policy templates for treasury management.
+
+Templates are built once, on first access of TREASURY_POLICY_TEMPLATES
+(PEP 562 module __getattr__), and exposed read-only through a
+MappingProxyType; condition sequences are tuples, as in the wealth pack.
 """
 
-TREASURY_POLICY_TEMPLATES = {
-    "position_limit_policy": {
-        "name": "Position Limit Policy",
-        "description": "Enforce position limits per asset with escalation on breach",
-        "rule_definition": {
-            "type": "threshold_breach",
-            "conditions": [
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from packs.interning import intern_tree
+
+
+def _threshold_rule(*conditions):
+    """
+    Build a threshold_breach rule definition that fires on any condition.
+
+    Keeps key order (type, conditions, evaluation_logic) so stored
+    rule_definition JSON is unchanged.
+    """
+    return {
+        "type": "threshold_breach",
+        "conditions": conditions,
+        "evaluation_logic": "any_condition_met",
+    }
+
+
+_CONDITION_KEYS = ("signal_type", "threshold", "severity_mapping")
+_THRESHOLD_KEYS = ("field", "operator", "value")
+
+
+def _validate_policy_templates(templates: Mapping[str, Any]) -> None:
+    """
+    Check the structure of every policy template once, at build time.
+
+    The templates are immutable afterwards, so nothing downstream needs
+    to re-check them. Raises ValueError naming the first bad template.
+    """
+    for name, template in templates.items():
+        rule = template.get("rule_definition") or {}
+        if "type" not in rule or not rule.get("conditions"):
+            raise ValueError(f"Policy template {name!r} needs a rule type and conditions")
+        for condition in rule["conditions"]:
+            missing = [key for key in _CONDITION_KEYS if key not in condition]
+            missing += [key for key in _THRESHOLD_KEYS if key not in condition.get("threshold", {})]
+            if missing:
+                raise ValueError(f"Policy template {name!r} condition is missing {missing}")
+            if "default" not in condition["severity_mapping"]:
+                raise ValueError(f"Policy template {name!r} severity_mapping has no default")
+
+
+def _build_policy_templates():
+    """Build and validate the treasury policy templates."""
+    templates = MappingProxyType(intern_tree({
+        "position_limit_policy": {
+            "name": "Position Limit Policy",
+            "description": "Enforce position limits per asset with escalation on breach",
+            "rule_definition": _threshold_rule(
                 {
                     "signal_type": "position_limit_breach",
                     "threshold": {
@@ -25,16 +73,12 @@ TREASURY_POLICY_TEMPLATES = {
                         "default": "medium"
                     },
                 }
-            ],
-            "evaluation_logic": "any_condition_met",  # 'any' or 'all'
+            ),
         },
-    },
-    "volatility_policy": {
-        "name": "Market Volatility Policy",
-        "description": "Monitor and escalate on volatility spikes",
-        "rule_definition": {
-            "type": "threshold_breach",
-            "conditions": [
+        "volatility_policy": {
+            "name": "Market Volatility Policy",
+            "description": "Monitor and escalate on volatility spikes",
+            "rule_definition": _threshold_rule(
                 {
                     "signal_type": "market_volatility_spike",
                     "threshold": {
@@ -46,16 +90,12 @@ TREASURY_POLICY_TEMPLATES = {
                         "default": "high",
                     },
                 }
-            ],
-            "evaluation_logic": "any_condition_met",
+            ),
         },
-    },
-    "credit_risk_policy": {
-        "name": "Counterparty Credit Risk Policy",
-        "description": "Monitor counterparty credit ratings and exposure",
-        "rule_definition": {
-            "type": "threshold_breach",
-            "conditions": [
+        "credit_risk_policy": {
+            "name": "Counterparty Credit Risk Policy",
+            "description": "Monitor counterparty credit ratings and exposure",
+            "rule_definition": _threshold_rule(
                 {
                     "signal_type": "counterparty_credit_downgrade",
                     "threshold": {
@@ -67,16 +107,12 @@ TREASURY_POLICY_TEMPLATES = {
                         "default": "high",
                     },
                 }
-            ],
-            "evaluation_logic": "any_condition_met",
+            ),
         },
-    },
-    "liquidity_policy": {
-        "name": "Liquidity Management Policy",
-        "description": "Ensure adequate liquidity across asset classes",
-        "rule_definition": {
-            "type": "threshold_breach",
-            "conditions": [
+        "liquidity_policy": {
+            "name": "Liquidity Management Policy",
+            "description": "Ensure adequate liquidity across asset classes",
+            "rule_definition": _threshold_rule(
                 {
                     "signal_type": "liquidity_threshold_breach",
                     "threshold": {
@@ -90,16 +126,12 @@ TREASURY_POLICY_TEMPLATES = {
                         "default": "medium"
                     },
                 }
-            ],
-            "evaluation_logic": "any_condition_met",
+            ),
         },
-    },
-    "fx_exposure_policy": {
-        "name": "FX Exposure Policy",
-        "description": "Monitor and control foreign exchange exposure limits",
-        "rule_definition": {
-            "type": "threshold_breach",
-            "conditions": [
+        "fx_exposure_policy": {
+            "name": "FX Exposure Policy",
+            "description": "Monitor and control foreign exchange exposure limits",
+            "rule_definition": _threshold_rule(
                 {
                     "signal_type": "fx_exposure_breach",
                     "threshold": {
@@ -113,16 +145,12 @@ TREASURY_POLICY_TEMPLATES = {
                         "default": "medium"
                     },
                 }
-            ],
-            "evaluation_logic": "any_condition_met",
+            ),
         },
-    },
-    "cash_management_policy": {
-        "name": "Cash Forecasting Policy",
-        "description": "Monitor cash position variances from forecasts",
-        "rule_definition": {
-            "type": "threshold_breach",
-            "conditions": [
+        "cash_management_policy": {
+            "name": "Cash Forecasting Policy",
+            "description": "Monitor cash position variances from forecasts",
+            "rule_definition": _threshold_rule(
                 {
                     "signal_type": "cash_forecast_variance",
                     "threshold": {
@@ -137,16 +165,12 @@ TREASURY_POLICY_TEMPLATES = {
                         "default": "medium"
                     },
                 }
-            ],
-            "evaluation_logic": "any_condition_met",
+            ),
         },
-    },
-    "covenant_monitoring_policy": {
-        "name": "Covenant Monitoring Policy",
-        "description": "Monitor financial covenant compliance",
-        "rule_definition": {
-            "type": "threshold_breach",
-            "conditions": [
+        "covenant_monitoring_policy": {
+            "name": "Covenant Monitoring Policy",
+            "description": "Monitor financial covenant compliance",
+            "rule_definition": _threshold_rule(
                 {
                     "signal_type": "covenant_breach",
                     "threshold": {
@@ -160,16 +184,12 @@ TREASURY_POLICY_TEMPLATES = {
                         "default": "high"
                     },
                 }
-            ],
-            "evaluation_logic": "any_condition_met",
+            ),
         },
-    },
-    "settlement_policy": {
-        "name": "Settlement Risk Policy",
-        "description": "Monitor and escalate trade settlement failures",
-        "rule_definition": {
-            "type": "threshold_breach",
-            "conditions": [
+        "settlement_policy": {
+            "name": "Settlement Risk Policy",
+            "description": "Monitor and escalate trade settlement failures",
+            "rule_definition": _threshold_rule(
                 {
                     "signal_type": "settlement_failure",
                     "threshold": {
@@ -183,8 +203,23 @@ TREASURY_POLICY_TEMPLATES = {
                         "default": "medium"
                     },
                 }
-            ],
-            "evaluation_logic": "any_condition_met",
+            ),
         },
-    },
-}
+    }))
+    _validate_policy_templates(templates)
+    return templates
+
+
+def _policy_templates():
+    """Return the templates, building them on first use."""
+    templates = globals().get("TREASURY_POLICY_TEMPLATES")
+    if templates is None:
+        templates = globals()["TREASURY_POLICY_TEMPLATES"] = _build_policy_templates()
+    return templates
+
+
+def __getattr__(name):
+    """Build TREASURY_POLICY_TEMPLATES lazily (PEP 562)."""
+    if name == "TREASURY_POLICY_TEMPLATES":
+        return _policy_templates()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
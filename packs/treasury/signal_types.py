@@ -2,9 +2,12 @@
 Treasury Pack - Signal Type Definitions.
 
 Defines the signal types used in treasury management.
+The registry is read-only (MappingProxyType).
 """
 
-TREASURY_SIGNAL_TYPES = {
+from types import MappingProxyType
+
+TREASURY_SIGNAL_TYPES = MappingProxyType({
     "position_limit_breach": {
         "description": "Asset position exceeds configured limit",
         "payload_schema": {
@@ -165,4 +168,4 @@ TREASURY_SIGNAL_TYPES = {
             "root_cause": "intraday_timing_mismatch"
         }
     },
-}
+})
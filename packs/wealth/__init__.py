@@ -23,14 +23,35 @@ Policies (8):
 - Withdrawal Policy
 - Correlation Risk Policy
 - Fee Change Policy
+
+The registries below are imported lazily, so importing one submodule
+(or the package itself) does not load the others.
 """
 
-from .signal_types import WEALTH_SIGNAL_TYPES
-from .policy_templates import WEALTH_POLICY_TEMPLATES
-from .option_templates import WEALTH_OPTION_TEMPLATES
+from importlib import import_module
 
 __all__ = [
     "WEALTH_SIGNAL_TYPES",
     "WEALTH_POLICY_TEMPLATES",
     "WEALTH_OPTION_TEMPLATES",
 ]
+
+# Exported name -> submodule defining it, imported on first access
+_EXPORTS = {
+    "WEALTH_SIGNAL_TYPES": ".signal_types",
+    "WEALTH_POLICY_TEMPLATES": ".policy_templates",
+    "WEALTH_OPTION_TEMPLATES": ".option_templates",
+}
+
+
+def __getattr__(name):
+    """Import pack registries on first access (PEP 562)."""
+    if name in _EXPORTS:
+        value = globals()[name] = getattr(import_module(_EXPORTS[name], __name__), name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include the lazily imported registries in dir()."""
+    return sorted(set(globals()) | set(__all__))
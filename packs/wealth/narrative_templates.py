@@ -3,32 +3,38 @@ Wealth Pack - Narrative Memo Templates.
 
 Defines templates for wealth management-specific narrative memos.
 Each template specifies structure, focus areas, and domain vocabulary.
+The registry is read-only (MappingProxyType).
 """
 
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Mapping
+
 from coprocessor.schemas.narrative import MemoTemplate, MemoTemplateConfig
 
 
-WEALTH_NARRATIVE_TEMPLATES = {
+WEALTH_NARRATIVE_TEMPLATES = MappingProxyType({
     MemoTemplate.WEALTH_SUITABILITY: MemoTemplateConfig(
         template_id=MemoTemplate.WEALTH_SUITABILITY,
         name="Wealth Suitability Exception Memo",
         description="Memo for client suitability mismatches and risk profile exceptions",
         pack="wealth",
-        required_sections=[
+        required_sections=(
             "Client Profile",
             "Suitability Issue",
             "Resolution",
-        ],
+        ),
         max_sections=5,
         max_claims_per_section=8,
-        focus_areas=[
+        focus_areas=(
             "Client risk profile and investment objectives",
             "Nature of suitability mismatch",
             "Holdings or recommendations in question",
             "Decision and rationale",
             "Client communication (if applicable)",
-        ],
-        vocabulary_hints=[
+        ),
+        vocabulary_hints=(
             "risk tolerance",
             "investment objective",
             "time horizon",
@@ -37,7 +43,7 @@ WEALTH_NARRATIVE_TEMPLATES = {
             "risk capacity",
             "investment policy statement",
             "fiduciary duty",
-        ],
+        ),
     ),
 
     MemoTemplate.WEALTH_PORTFOLIO: MemoTemplateConfig(
@@ -45,21 +51,21 @@ WEALTH_NARRATIVE_TEMPLATES = {
         name="Wealth Portfolio Exception Memo",
         description="Memo for portfolio drift, concentration, and rebalancing exceptions",
         pack="wealth",
-        required_sections=[
+        required_sections=(
             "Portfolio Status",
             "Exception Details",
             "Action Taken",
-        ],
+        ),
         max_sections=5,
         max_claims_per_section=8,
-        focus_areas=[
+        focus_areas=(
             "Current allocation vs. target",
             "Drift or concentration details",
             "Market context (if in evidence)",
             "Rebalancing decision",
             "Tax implications (if applicable)",
-        ],
-        vocabulary_hints=[
+        ),
+        vocabulary_hints=(
             "asset allocation",
             "target allocation",
             "drift threshold",
@@ -68,7 +74,7 @@ WEALTH_NARRATIVE_TEMPLATES = {
             "sector exposure",
             "tax-loss harvesting",
             "capital gains",
-        ],
+        ),
     ),
 
     MemoTemplate.WEALTH_CLIENT: MemoTemplateConfig(
@@ -76,21 +82,21 @@ WEALTH_NARRATIVE_TEMPLATES = {
         name="Wealth Client Service Memo",
         description="Memo for client-initiated requests and service exceptions",
         pack="wealth",
-        required_sections=[
+        required_sections=(
             "Client Request",
             "Assessment",
             "Resolution",
-        ],
+        ),
         max_sections=5,
         max_claims_per_section=8,
-        focus_areas=[
+        focus_areas=(
             "Nature of client request",
             "Relevant account and holdings context",
             "Compliance and suitability check",
             "Decision and execution",
             "Client communication",
-        ],
-        vocabulary_hints=[
+        ),
+        vocabulary_hints=(
             "withdrawal request",
             "transfer",
             "beneficiary",
@@ -98,7 +104,7 @@ WEALTH_NARRATIVE_TEMPLATES = {
             "client instruction",
             "authorization",
             "account status",
-        ],
+        ),
     ),
 
     MemoTemplate.EXECUTIVE_SUMMARY: MemoTemplateConfig(
@@ -106,10 +112,10 @@ WEALTH_NARRATIVE_TEMPLATES = {
         name="Executive Summary",
         description="High-level summary for senior leadership",
         pack="wealth",
-        required_sections=[
+        required_sections=(
             "Key Facts",
             "Decision",
-        ],
+        ),
         max_sections=3,
         max_claims_per_section=4,
         length_guidelines={
@@ -117,12 +123,12 @@ WEALTH_NARRATIVE_TEMPLATES = {
             "standard": {"max_sections": 2, "max_claims_per_section": 3},
             "detailed": {"max_sections": 3, "max_claims_per_section": 4},
         },
-        focus_areas=[
+        focus_areas=(
             "Bottom line: what happened and what was decided",
             "Key numbers only",
             "No operational details",
-        ],
-        vocabulary_hints=[],
+        ),
+        vocabulary_hints=(),
     ),
 
     MemoTemplate.DECISION_BRIEF: MemoTemplateConfig(
@@ -130,21 +136,21 @@ WEALTH_NARRATIVE_TEMPLATES = {
         name="Decision Brief",
         description="Standard decision documentation memo",
         pack="wealth",
-        required_sections=[
+        required_sections=(
             "Situation",
             "Options Considered",
             "Decision",
-        ],
+        ),
         max_sections=4,
         max_claims_per_section=6,
-        focus_areas=[
+        focus_areas=(
             "What triggered the exception",
             "All options that were available",
             "Which option was selected and why",
-        ],
-        vocabulary_hints=[],
+        ),
+        vocabulary_hints=(),
     ),
-}
+})
 
 
 def get_wealth_template(template_id: MemoTemplate) -> MemoTemplateConfig:
@@ -154,16 +160,18 @@ def get_wealth_template(template_id: MemoTemplate) -> MemoTemplateConfig:
     return WEALTH_NARRATIVE_TEMPLATES[template_id]
 
 
+_SIGNAL_TO_TEMPLATE: Mapping[str, MemoTemplate] = MappingProxyType({
+    "portfolio_drift": MemoTemplate.WEALTH_PORTFOLIO,
+    "rebalancing_required": MemoTemplate.WEALTH_PORTFOLIO,
+    "concentration_breach": MemoTemplate.WEALTH_PORTFOLIO,
+    "suitability_mismatch": MemoTemplate.WEALTH_SUITABILITY,
+    "client_cash_withdrawal": MemoTemplate.WEALTH_CLIENT,
+    "tax_loss_harvest_opportunity": MemoTemplate.WEALTH_PORTFOLIO,
+    "market_correlation_spike": MemoTemplate.WEALTH_PORTFOLIO,
+    "fee_schedule_change": MemoTemplate.WEALTH_CLIENT,
+})
+
+
 def get_template_for_signal_type(signal_type: str) -> MemoTemplate:
     """Map signal type to recommended template."""
-    signal_to_template = {
-        "portfolio_drift": MemoTemplate.WEALTH_PORTFOLIO,
-        "rebalancing_required": MemoTemplate.WEALTH_PORTFOLIO,
-        "concentration_breach": MemoTemplate.WEALTH_PORTFOLIO,
-        "suitability_mismatch": MemoTemplate.WEALTH_SUITABILITY,
-        "client_cash_withdrawal": MemoTemplate.WEALTH_CLIENT,
-        "tax_loss_harvest_opportunity": MemoTemplate.WEALTH_PORTFOLIO,
-        "market_correlation_spike": MemoTemplate.WEALTH_PORTFOLIO,
-        "fee_schedule_change": MemoTemplate.WEALTH_CLIENT,
-    }
-    return signal_to_template.get(signal_type, MemoTemplate.DECISION_BRIEF)
+    return _SIGNAL_TO_TEMPLATE.get(signal_type, MemoTemplate.DECISION_BRIEF)
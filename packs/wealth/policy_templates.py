@@ -10,15 +10,22 @@ Defines reusable policy templates for wealth management:
 - Withdrawal Policy
 - Correlation Risk Policy
 - Fee Change Policy
+
+The registry is read-only (MappingProxyType) and condition sequences are
+tuples, so the shared instance needs no defensive copies.
 """
 
-WEALTH_POLICY_TEMPLATES = {
+from types import MappingProxyType
+
+from packs.interning import intern_tree
+
+WEALTH_POLICY_TEMPLATES = MappingProxyType(intern_tree({
     "portfolio_drift_policy": {
         "name": "Portfolio Drift Policy",
         "description": "Monitor and escalate when portfolio allocation drifts from target",
         "rule_definition": {
             "type": "threshold_breach",
-            "conditions": [
+            "conditions": (
                 {
                     "signal_type": "portfolio_drift",
                     "threshold": {
@@ -31,8 +38,8 @@ WEALTH_POLICY_TEMPLATES = {
                         "drift_percent > 10": "high",
                         "default": "medium",
                     },
-                }
-            ],
+                },
+            ),
             "evaluation_logic": "any_condition_met",
         },
     },
@@ -41,7 +48,7 @@ WEALTH_POLICY_TEMPLATES = {
         "description": "Trigger rebalancing based on calendar and threshold rules",
         "rule_definition": {
             "type": "threshold_breach",
-            "conditions": [
+            "conditions": (
                 {
                     "signal_type": "rebalancing_required",
                     "threshold": {
@@ -67,7 +74,7 @@ WEALTH_POLICY_TEMPLATES = {
                         "default": "medium",
                     },
                 },
-            ],
+            ),
             "evaluation_logic": "any_condition_met",
         },
     },
@@ -76,7 +83,7 @@ WEALTH_POLICY_TEMPLATES = {
         "description": "Ensure portfolio risk matches client risk profile",
         "rule_definition": {
             "type": "threshold_breach",
-            "conditions": [
+            "conditions": (
                 {
                     "signal_type": "suitability_mismatch",
                     "threshold": {
@@ -90,8 +97,8 @@ WEALTH_POLICY_TEMPLATES = {
                         "risk_delta < -2": "high",  # Too conservative also matters
                         "default": "high",
                     },
-                }
-            ],
+                },
+            ),
             "evaluation_logic": "any_condition_met",
         },
     },
@@ -100,7 +107,7 @@ WEALTH_POLICY_TEMPLATES = {
         "description": "Monitor single position concentration limits",
         "rule_definition": {
             "type": "threshold_breach",
-            "conditions": [
+            "conditions": (
                 {
                     "signal_type": "concentration_breach",
                     "threshold": {
@@ -113,8 +120,8 @@ WEALTH_POLICY_TEMPLATES = {
                         "current_weight_percent > 15": "high",
                         "default": "medium",
                     },
-                }
-            ],
+                },
+            ),
             "evaluation_logic": "any_condition_met",
         },
     },
@@ -123,7 +130,7 @@ WEALTH_POLICY_TEMPLATES = {
         "description": "Identify and escalate tax-loss harvesting opportunities",
         "rule_definition": {
             "type": "threshold_breach",
-            "conditions": [
+            "conditions": (
                 {
                     "signal_type": "tax_loss_harvest_opportunity",
                     "threshold": {
@@ -136,8 +143,8 @@ WEALTH_POLICY_TEMPLATES = {
                         "estimated_tax_savings_usd > 10000": "medium",
                         "default": "low",
                     },
-                }
-            ],
+                },
+            ),
             "evaluation_logic": "any_condition_met",
         },
     },
@@ -146,7 +153,7 @@ WEALTH_POLICY_TEMPLATES = {
         "description": "Monitor and approve large client withdrawal requests",
         "rule_definition": {
             "type": "threshold_breach",
-            "conditions": [
+            "conditions": (
                 {
                     "signal_type": "client_cash_withdrawal",
                     "threshold": {
@@ -173,7 +180,7 @@ WEALTH_POLICY_TEMPLATES = {
                         "default": "medium",
                     },
                 },
-            ],
+            ),
             "evaluation_logic": "any_condition_met",
         },
     },
@@ -182,7 +189,7 @@ WEALTH_POLICY_TEMPLATES = {
         "description": "Monitor portfolio diversification and correlation risk",
         "rule_definition": {
             "type": "threshold_breach",
-            "conditions": [
+            "conditions": (
                 {
                     "signal_type": "market_correlation_spike",
                     "threshold": {
@@ -208,7 +215,7 @@ WEALTH_POLICY_TEMPLATES = {
                         "default": "medium",
                     },
                 },
-            ],
+            ),
             "evaluation_logic": "any_condition_met",
         },
     },
@@ -217,7 +224,7 @@ WEALTH_POLICY_TEMPLATES = {
         "description": "Manage fee schedule changes and client notifications",
         "rule_definition": {
             "type": "threshold_breach",
-            "conditions": [
+            "conditions": (
                 {
                     "signal_type": "fee_schedule_change",
                     "threshold": {
@@ -245,8 +252,8 @@ WEALTH_POLICY_TEMPLATES = {
                         "default": "low",
                     },
                 },
-            ],
+            ),
             "evaluation_logic": "any_condition_met",
         },
     },
-}
+}))
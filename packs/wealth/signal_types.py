@@ -12,7 +12,9 @@ Defines the 8 signal types for wealth management:
 - fee_schedule_change
 """
 
-WEALTH_SIGNAL_TYPES = {
+from types import MappingProxyType
+
+WEALTH_SIGNAL_TYPES = MappingProxyType({
     "portfolio_drift": {
         "description": "Portfolio allocation has drifted from target allocation",
         "payload_schema": {
@@ -173,4 +175,4 @@ WEALTH_SIGNAL_TYPES = {
             "requires_consent == true": "high",
         },
     },
-}
+})
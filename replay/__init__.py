@@ -3,11 +3,12 @@ Replay Module - Policy tuning without production risk.
 
 Provides CSV ingestion with provenance, replay harness for deterministic
 evaluation, and comparison tools for before/after analysis.
+
+The exports below are imported lazily, so importing a submodule (such as
+replay.cli) does not load the ingestor, harness and comparison modules.
 """
 
-from .csv_ingestor import CSVIngestor
-from .harness import ReplayHarness
-from .comparison import compare_evaluations, ComparisonResult
+from importlib import import_module
 
 __all__ = [
     "CSVIngestor",
@@ -15,3 +16,24 @@ __all__ = [
     "compare_evaluations",
     "ComparisonResult",
 ]
+
+# Exported name -> submodule defining it, imported on first access
+_EXPORTS = {
+    "CSVIngestor": ".csv_ingestor",
+    "ReplayHarness": ".harness",
+    "compare_evaluations": ".comparison",
+    "ComparisonResult": ".comparison",
+}
+
+
+def __getattr__(name):
+    """Import replay components on first access (PEP 562)."""
+    if name in _EXPORTS:
+        value = globals()[name] = getattr(import_module(_EXPORTS[name], __name__), name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    """Include the lazily imported components in dir()."""
+    return sorted(set(globals()) | set(__all__))
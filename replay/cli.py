@@ -11,13 +11,17 @@ import argparse
 import json
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from .csv_ingestor import CSVIngestor, ColumnMapping
-from .harness import ReplayHarness, ReplayConfig
-from .comparison import compare_evaluations, generate_comparison_report
-from .metrics import MetricsCalculator, generate_metrics_report
+import orjson
+
+# The ingestor, harness and metrics modules (and pydantic) are imported
+# inside the commands that use them, so --help and compare start quickly.
+
+# Write buffer for streamed (NDJSON) output
+_OUTPUT_BUFFER_SIZE = 1 << 20
 
 
 def parse_date(date_str: str) -> datetime:
@@ -25,8 +29,37 @@ def parse_date(date_str: str) -> datetime:
     return datetime.strptime(date_str, "%Y-%m-%d")
 
 
+@lru_cache(maxsize=32)
+def _load_replay(path_str: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a replay output file. mtime_ns and size are cache-key only."""
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+def load_replay(path: Path) -> Dict[str, Any]:
+    """
+    Load a replay output file written by `run --output`.
+
+    Parsed files are cached by (path, mtime, size), so comparing against
+    the same baseline again skips the parse while edited files are re-read.
+    The returned dict is shared between calls and must not be mutated.
+    """
+    stat = path.stat()
+    return _load_replay(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write data as indented JSON (orjson; unknown types fall back to str)."""
+    path.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+
+
 def cmd_run(args) -> int:
     """Run replay on historical signals."""
+    from pydantic import TypeAdapter
+
+    from .csv_ingestor import IngestedSignal
+    from .harness import ExceptionRaised, ReplayConfig, ReplayHarness
+    from .metrics import MetricsCalculator, generate_metrics_report
+
     print(f"Running replay for pack: {args.pack}")
     print(f"Namespace: {args.namespace or 'auto-generated'}")
 
@@ -51,7 +84,9 @@ def cmd_run(args) -> int:
         return 1
     else:
         print("\nRunning with sample data (use --db for database mode)...")
-        from .csv_ingestor import IngestedSignal
+
+        # One timestamp for all samples; naive UTC, like --from/--to dates
+        now = datetime.utcnow()
 
         # Sample signals for demo
         sample_signals = [
@@ -64,7 +99,7 @@ def cmd_run(args) -> int:
                     "limit": 100000000,
                     "currency": "USD"
                 },
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             ),
             IngestedSignal(
                 signal_type="market_volatility_spike",
@@ -75,7 +110,7 @@ def cmd_run(args) -> int:
                     "threshold": 0.6,
                     "timeframe": "24h"
                 },
-                timestamp=datetime.utcnow(),
+                timestamp=now,
             ),
         ]
 
@@ -132,11 +167,9 @@ def cmd_run(args) -> int:
     print(f"  Exceptions raised: {len(result.exceptions_raised)}")
     print(f"  Pass: {result.pass_count}, Fail: {result.fail_count}, Inconclusive: {result.inconclusive_count}")
 
-    # Calculate and display metrics
-    calculator = MetricsCalculator()
-    metrics = calculator.calculate(result)
-
+    # Calculate and display metrics (only shown in verbose mode)
     if args.verbose:
+        metrics = MetricsCalculator().calculate(result)
         print("\n" + generate_metrics_report(metrics))
 
     # Output results if requested
@@ -153,11 +186,12 @@ def cmd_run(args) -> int:
                 "pass_count": result.pass_count,
                 "fail_count": result.fail_count,
             },
-            "exceptions": [e.model_dump(mode="json") for e in result.exceptions_raised],
+            "exceptions": TypeAdapter(List[ExceptionRaised]).dump_python(
+                result.exceptions_raised, mode="json"
+            ),
         }
 
-        with open(output_path, "w") as f:
-            json.dump(output_data, f, indent=2, default=str)
+        _write_json(output_path, output_data)
         print(f"\nResults written to: {output_path}")
 
     return 0
@@ -165,6 +199,10 @@ def cmd_run(args) -> int:
 
 def cmd_ingest(args) -> int:
     """Ingest signals from a CSV file."""
+    from pydantic import TypeAdapter
+
+    from .csv_ingestor import CSVIngestor, ColumnMapping, IngestedSignal
+
     filepath = Path(args.file)
     if not filepath.exists():
         print(f"Error: File not found: {filepath}")
@@ -212,16 +250,23 @@ def cmd_ingest(args) -> int:
     # Output results if requested
     if args.output:
         output_path = Path(args.output)
-        output_data = {
-            "batch_id": batch.batch_id,
-            "source_file": batch.source_file,
-            "file_hash": batch.file_hash,
-            "row_count": batch.row_count,
-            "signals": [s.model_dump(mode="json") for s in batch.signals],
-        }
-
-        with open(output_path, "w") as f:
-            json.dump(output_data, f, indent=2, default=str)
+        if output_path.suffix == ".ndjson":
+            # One signal per line, serialized straight to JSON bytes by
+            # pydantic-core and written through a 1 MiB buffer
+            serializer = IngestedSignal.__pydantic_serializer__
+            with output_path.open("wb", buffering=_OUTPUT_BUFFER_SIZE) as f:
+                for s in batch.signals:
+                    f.write(serializer.to_json(s))
+                    f.write(b"\n")
+        else:
+            output_data = {
+                "batch_id": batch.batch_id,
+                "source_file": batch.source_file,
+                "file_hash": batch.file_hash,
+                "row_count": batch.row_count,
+                "signals": TypeAdapter(List[IngestedSignal]).dump_python(batch.signals, mode="json"),
+            }
+            _write_json(output_path, output_data)
         print(f"\nResults written to: {output_path}")
 
     return 0
@@ -245,9 +290,23 @@ def cmd_compare(args) -> int:
         print(f"Error: Comparison file not found: {comparison_path}")
         return 1
 
-    # TODO: Implement loading ReplayResult from JSON files
-    print("\nComparison from files not yet implemented.")
-    print("Run replays with --output flag first, then compare.")
+    try:
+        baseline = load_replay(baseline_path)
+        comparison = load_replay(comparison_path)
+    except orjson.JSONDecodeError as e:
+        print(f"Error: Invalid replay result file: {e}")
+        return 1
+
+    # Output files carry summary counts only; per-evaluation comparison
+    # (compare_evaluations) needs the evaluations written out as well.
+    baseline_summary = baseline.get("summary", {})
+    comparison_summary = comparison.get("summary", {})
+
+    print("\nSummary (baseline -> comparison):")
+    for key in ("signals_processed", "evaluations", "exceptions", "pass_count", "fail_count"):
+        before = baseline_summary.get(key, 0)
+        after = comparison_summary.get(key, 0)
+        print(f"  {key}: {before} -> {after} ({after - before:+d})")
 
     return 0
 
@@ -279,7 +338,7 @@ def main():
     ingest_parser.add_argument("--source-col", help="Column name for source")
     ingest_parser.add_argument("--mapping", help="JSON mapping of payload columns")
     ingest_parser.add_argument("--skip-errors", action="store_true", help="Skip rows with errors")
-    ingest_parser.add_argument("--output", "-o", help="Output file for results (JSON)")
+    ingest_parser.add_argument("--output", "-o", help="Output file for results (JSON, or one signal per line if .ndjson)")
     ingest_parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     # Compare command
@@ -6,11 +6,18 @@ of deterministic behavior.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
-from .harness import EvaluationResult, ReplayResult
+from .harness import EvaluationResult, ExceptionRaised, ReplayResult
+
+# Rows fetched per batch when streaming production evaluations
+_PRODUCTION_BATCH_SIZE = 1000
+
+# Determinism failure messages kept on a ComparisonResult; the rest are counted
+_MAX_DETERMINISM_FAILURES = 5
 
 
 class EvaluationDiff(BaseModel):
@@ -57,6 +64,7 @@ class ComparisonResult(BaseModel):
     # Determinism check
     is_deterministic: bool = True
     determinism_failures: List[str] = Field(default_factory=list)
+    determinism_failures_omitted: int = 0
 
     # Detailed diffs
     diffs: List[EvaluationDiff] = Field(default_factory=list)
@@ -78,15 +86,21 @@ class ComparisonResult(BaseModel):
 def compare_evaluations(
     baseline: ReplayResult,
     comparison: ReplayResult,
-    check_determinism: bool = True
+    check_determinism: bool = True,
+    collect_diffs: bool = True
 ) -> ComparisonResult:
     """
     Compare two replay results.
 
+    Only the first few determinism failure messages are kept; any
+    further failures are counted in determinism_failures_omitted.
+
     Args:
         baseline: The baseline replay result (e.g., production or previous run)
         comparison: The comparison replay result (e.g., replay or new policy version)
         check_determinism: If True, verify that same inputs produce same outputs
+        collect_diffs: If False, only count divergent evaluations and leave
+            diffs empty
 
     Returns:
         ComparisonResult with detailed comparison metrics
@@ -110,22 +124,26 @@ def compare_evaluations(
         key = (eval.signal_id, eval.policy_id)
         comparison_index[key] = eval
 
-    # Find all unique keys
-    all_keys = set(baseline_index.keys()) | set(comparison_index.keys())
-    result.total_evaluations = len(all_keys)
-
-    for key in all_keys:
-        baseline_eval = baseline_index.get(key)
-        comparison_eval = comparison_index.get(key)
-
-        if baseline_eval and comparison_eval:
-            # Both exist - compare them
-            result_changed = baseline_eval.result != comparison_eval.result
-            severity_changed = baseline_eval.severity != comparison_eval.severity
-
-            if result_changed or severity_changed:
-                result.divergent_evaluations += 1
-                result.diffs.append(EvaluationDiff(
+    # Join in one pass over the comparison side: matched baseline entries
+    # are popped, so whatever remains afterwards is baseline-only
+    matching = divergent = comparison_only = 0
+    diffs = result.diffs
+    failures = result.determinism_failures
+    for key, comparison_eval in comparison_index.items():
+        baseline_eval = baseline_index.pop(key, None)
+
+        if baseline_eval is None:
+            comparison_only += 1
+            continue
+
+        # Both exist - compare them
+        result_changed = baseline_eval.result != comparison_eval.result
+        severity_changed = baseline_eval.severity != comparison_eval.severity
+
+        if result_changed or severity_changed:
+            divergent += 1
+            if collect_diffs:
+                diffs.append(EvaluationDiff(
                     signal_id=key[0],
                     policy_id=key[1],
                     input_hash=baseline_eval.input_hash,
@@ -139,20 +157,23 @@ def compare_evaluations(
                     comparison_details=comparison_eval.details
                 ))
 
-                # Check determinism
-                if check_determinism and baseline_eval.input_hash == comparison_eval.input_hash:
-                    if result_changed:
-                        result.is_deterministic = False
-                        result.determinism_failures.append(
-                            f"Same input hash {baseline_eval.input_hash[:16]}... produced different results"
-                        )
-            else:
-                result.matching_evaluations += 1
-
-        elif baseline_eval:
-            result.baseline_only += 1
+            # Check determinism
+            if check_determinism and result_changed and baseline_eval.input_hash == comparison_eval.input_hash:
+                result.is_deterministic = False
+                if len(failures) < _MAX_DETERMINISM_FAILURES:
+                    failures.append(
+                        f"Same input hash {baseline_eval.input_hash[:16]}... produced different results"
+                    )
+                else:
+                    result.determinism_failures_omitted += 1
         else:
-            result.comparison_only += 1
+            matching += 1
+
+    result.matching_evaluations = matching
+    result.divergent_evaluations = divergent
+    result.comparison_only = comparison_only
+    result.baseline_only = len(baseline_index)
+    result.total_evaluations = len(comparison_index) + result.baseline_only
 
     # Compare exceptions
     baseline_fingerprints = {e.fingerprint for e in baseline.exceptions_raised}
@@ -182,15 +203,42 @@ def compare_with_production(
     Returns:
         ComparisonResult comparing replay vs production
     """
-    from core.models import Evaluation, Exception as DBException
-
-    # Load production evaluations for the same signals
-    signal_ids = list({e.signal_id for e in replay_result.evaluations})
-
-    production_evals = db_session.query(Evaluation).filter(
-        Evaluation.signal_id.in_(signal_ids),
-        Evaluation.replay_namespace == namespace
-    ).all()
+    from sqlalchemy import select
+
+    from core.models import Evaluation, Exception as DBException, PolicyVersion
+
+    # Production evaluations cover a list of signals, so load every one that
+    # shares a signal with the replay (a single array parameter), together
+    # with the exceptions it raised. Only the converted columns are selected
+    # and rows are streamed in batches rather than materialized at once.
+    signal_ids = {e.signal_id for e in replay_result.evaluations}
+
+    stmt = (
+        select(
+            Evaluation.id.label("evaluation_id"),
+            Evaluation.policy_version_id,
+            Evaluation.signal_ids,
+            Evaluation.result,
+            Evaluation.details,
+            Evaluation.input_hash,
+            Evaluation.evaluated_at,
+            PolicyVersion.policy_id,
+            DBException.id.label("exception_id"),
+            DBException.title,
+            DBException.severity,
+            DBException.context,
+            DBException.fingerprint,
+        )
+        .join(PolicyVersion, Evaluation.policy_version_id == PolicyVersion.id)
+        .outerjoin(DBException, DBException.evaluation_id == Evaluation.id)
+        .where(
+            Evaluation.signal_ids.overlap(_signal_uuids(signal_ids)),
+            Evaluation.replay_namespace == namespace
+        )
+        .order_by(Evaluation.evaluated_at, Evaluation.id, DBException.raised_at)
+        .execution_options(yield_per=_PRODUCTION_BATCH_SIZE)
+    )
+    rows = db_session.execute(stmt)
 
     # Convert to ReplayResult format
     production_result = ReplayResult(
@@ -198,40 +246,93 @@ def compare_with_production(
         namespace=namespace,
         config=replay_result.config
     )
-
-    for eval in production_evals:
-        production_result.evaluations.append(EvaluationResult(
-            evaluation_id=str(eval.id),
-            policy_id=str(eval.policy_id),
-            policy_version_id=str(eval.policy_version_id),
-            signal_id=str(eval.signal_id),
-            result=eval.result.value if hasattr(eval.result, 'value') else eval.result,
-            severity=eval.severity.value if eval.severity and hasattr(eval.severity, 'value') else eval.severity,
-            details=eval.details or {},
-            input_hash=eval.input_hash or "",
-            evaluated_at=eval.evaluated_at
-        ))
-
-    # Load production exceptions
-    production_exceptions = db_session.query(DBException).filter(
-        DBException.id.in_([
-            e.exception_id for e in production_result.evaluations
-            if hasattr(e, 'exception_id')
-        ])
-    ).all()
-
-    production_result.exceptions_raised = [
-        {
-            "fingerprint": exc.fingerprint,
-            "policy_id": str(exc.policy_id),
-            "severity": exc.severity.value if hasattr(exc.severity, 'value') else exc.severity
-        }
-        for exc in production_exceptions
-    ]
+    production_result.evaluations, production_result.exceptions_raised = (
+        _convert_production_rows(rows, signal_ids)
+    )
 
     return compare_evaluations(production_result, replay_result)
 
 
+def _signal_uuids(signal_ids: Set[str]) -> List[UUID]:
+    """Convert replay signal IDs to UUIDs, skipping IDs no stored signal can have."""
+    uuids = []
+    for signal_id in signal_ids:
+        try:
+            uuids.append(UUID(signal_id))
+        except ValueError:
+            continue
+    return uuids
+
+
+def _convert_production_rows(
+    rows: Iterable[Any],
+    signal_ids: Set[str]
+) -> Tuple[List[EvaluationResult], List[ExceptionRaised]]:
+    """
+    Convert production evaluation/exception rows to replay models.
+
+    A production evaluation covers several signals while replay evaluates
+    one signal at a time, so each evaluation yields one result per replayed
+    signal. An evaluation appears once per exception it raised (or once with
+    a null exception_id); the first exception supplies its severity. The
+    values come straight from typed columns: enum columns are non-null, so
+    they are unwrapped without probing, and validation is skipped.
+
+    Args:
+        rows: Rows with the columns selected by compare_with_production
+        signal_ids: Signal IDs present in the replay result
+
+    Returns:
+        Tuple of (evaluations, exceptions) in row order
+    """
+    construct_evaluation = EvaluationResult.model_construct
+    construct_exception = ExceptionRaised.model_construct
+    evaluations = []
+    exceptions = []
+    seen = set()
+    for row in rows:
+        evaluation_id = str(row.evaluation_id)
+        policy_id = str(row.policy_id)
+        has_exception = row.exception_id is not None
+
+        if has_exception:
+            exceptions.append(construct_exception(
+                exception_id=str(row.exception_id),
+                title=row.title,
+                severity=row.severity.value,
+                policy_id=policy_id,
+                evaluation_id=evaluation_id,
+                signal_ids=[str(s) for s in row.signal_ids],
+                context=row.context or {},
+                fingerprint=row.fingerprint
+            ))
+
+        if evaluation_id in seen:
+            continue
+        seen.add(evaluation_id)
+
+        policy_version_id = str(row.policy_version_id)
+        result = row.result.value
+        severity = row.severity.value if has_exception else None
+        details = row.details or {}
+
+        for signal_id in map(str, row.signal_ids):
+            if signal_id not in signal_ids:
+                continue
+            evaluations.append(construct_evaluation(
+                evaluation_id=evaluation_id,
+                policy_id=policy_id,
+                policy_version_id=policy_version_id,
+                signal_id=signal_id,
+                result=result,
+                severity=severity,
+                details=details,
+                input_hash=row.input_hash,
+                evaluated_at=row.evaluated_at
+            ))
+    return evaluations, exceptions
+
+
 def generate_comparison_report(comparison: ComparisonResult) -> str:
     """
     Generate a human-readable comparison report.
@@ -268,10 +369,14 @@ def generate_comparison_report(comparison: ComparisonResult) -> str:
 
     if comparison.determinism_failures:
         lines.append("Failures:")
-        for failure in comparison.determinism_failures[:5]:
+        for failure in comparison.determinism_failures[:_MAX_DETERMINISM_FAILURES]:
             lines.append(f"  - {failure}")
-        if len(comparison.determinism_failures) > 5:
-            lines.append(f"  ... and {len(comparison.determinism_failures) - 5} more")
+        more = (
+            len(comparison.determinism_failures) - _MAX_DETERMINISM_FAILURES
+            + comparison.determinism_failures_omitted
+        )
+        if more > 0:
+            lines.append(f"  ... and {more} more")
 
     lines.extend([
         "",
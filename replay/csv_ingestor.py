@@ -7,11 +7,14 @@ for replay and audit purposes.
 
 import csv
 import hashlib
+import json
+import sys
 import time
 import uuid
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -49,11 +52,43 @@ def compute_signal_content_hash(
         "source": source,
         "observed_at": observed_str
     }
-    import json
     canonical = json.dumps(content, sort_keys=True, default=str)
     return hashlib.sha256(canonical.encode()).hexdigest()
 
 
+def compute_signal_content_hashes(pack: str, signals: Iterable["IngestedSignal"]) -> List[str]:
+    """
+    Compute compute_signal_content_hash for a batch of signals from one pack.
+
+    Builds the same canonical JSON piece by piece: the pack fragment is
+    encoded once and signal type / source strings once per distinct value,
+    leaving only the timestamp and payload to encode per signal.
+    """
+    # Keys in sort_keys order: observed_at, pack, payload, signal_type, source
+    pack_part = ', "pack": ' + json.dumps(pack) + ', "payload": '
+    encoded: Dict[str, str] = {}
+    dumps = json.dumps
+    sha256 = hashlib.sha256
+
+    hashes = []
+    for signal in signals:
+        signal_type = encoded.get(signal.signal_type)
+        if signal_type is None:
+            signal_type = encoded[signal.signal_type] = dumps(signal.signal_type)
+        source = encoded.get(signal.source)
+        if source is None:
+            source = encoded[signal.source] = dumps(signal.source)
+
+        canonical = (
+            '{"observed_at": ' + dumps(signal.timestamp.isoformat())
+            + pack_part + dumps(signal.payload, sort_keys=True, default=str)
+            + ', "signal_type": ' + signal_type
+            + ', "source": ' + source + '}'
+        )
+        hashes.append(sha256(canonical.encode()).hexdigest())
+    return hashes
+
+
 class IngestedSignal(BaseModel):
     """Signal with provenance metadata from CSV import."""
 
@@ -88,6 +123,77 @@ class ImportBatch(BaseModel):
     signals_deduplicated: int = 0
 
 
+def _parse_iso_timestamp(value: str) -> Optional[datetime]:
+    """
+    Parse zero-padded ISO timestamps by slicing, without strptime.
+
+    Handles "YYYY-MM-DD", "YYYY-MM-DD HH:MM:SS", "YYYY-MM-DDTHH:MM:SS" and
+    "YYYY-MM-DDTHH:MM:SSZ" (returned naive, as with strptime). Returns None
+    for any other shape or an out-of-range field, so the caller can fall
+    back to strptime.
+    """
+    length = len(value)
+    if length not in (10, 19, 20) or value[4] != "-" or value[7] != "-":
+        return None
+
+    try:
+        if length == 10:
+            if not (value[:4] + value[5:7] + value[8:]).isdigit():
+                return None
+            return datetime(int(value[:4]), int(value[5:7]), int(value[8:]))
+
+        if value[10] not in " T" or value[13] != ":" or value[16] != ":":
+            return None
+        if length == 20 and (value[10] != "T" or value[19] != "Z"):
+            return None
+        digits = value[:4] + value[5:7] + value[8:10] + value[11:13] + value[14:16] + value[17:19]
+        if not digits.isdigit():
+            return None
+        return datetime(
+            int(value[:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+        )
+    except ValueError:
+        return None
+
+
+_TIMESTAMP_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M:%SZ",
+    "%Y-%m-%d",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y",
+)
+
+# Formats split by date separator; a value can only match formats using its separator
+_SLASH_TIMESTAMP_FORMATS = tuple(fmt for fmt in _TIMESTAMP_FORMATS if "/" in fmt)
+_DASH_TIMESTAMP_FORMATS = tuple(fmt for fmt in _TIMESTAMP_FORMATS if "/" not in fmt)
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp_formats(value: str) -> Optional[datetime]:
+    """
+    Parse value with the first matching strptime format, or return None.
+
+    Cached: strptime is slow, and files of daily data repeat the same
+    non-ISO date strings on many rows (datetimes are immutable, so cached
+    results can be shared). Only formats with the value's date separator
+    are tried, so US dates skip the failing ISO attempts.
+    """
+    formats = _SLASH_TIMESTAMP_FORMATS if "/" in value else _DASH_TIMESTAMP_FORMATS
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+# Words float() parses (after lowercasing); any other value starting with a letter is a string
+_FLOAT_WORDS = frozenset({"inf", "infinity", "nan"})
+
+
 class CSVIngestor:
     """
     Ingests CSV files into signals with full provenance tracking.
@@ -119,22 +225,13 @@ class CSVIngestor:
 
     def _parse_timestamp(self, value: str) -> datetime:
         """Parse timestamp from various formats."""
-        formats = [
-            "%Y-%m-%d %H:%M:%S",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%dT%H:%M:%SZ",
-            "%Y-%m-%d",
-            "%m/%d/%Y %H:%M:%S",
-            "%m/%d/%Y",
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(value.strip(), fmt)
-            except ValueError:
-                continue
-
-        raise ValueError(f"Unable to parse timestamp: {value}")
+        stripped = value.strip()
+        parsed = _parse_iso_timestamp(stripped)
+        if parsed is None:
+            parsed = _parse_timestamp_formats(stripped)
+        if parsed is None:
+            raise ValueError(f"Unable to parse timestamp: {value}")
+        return parsed
 
     def _parse_value(self, value: str) -> Any:
         """Parse string value to appropriate type."""
@@ -142,10 +239,18 @@ class CSVIngestor:
             return None
 
         value = value.strip()
+        lowered = value.lower()
 
         # Try boolean
-        if value.lower() in ("true", "false"):
-            return value.lower() == "true"
+        if lowered in ("true", "false"):
+            return lowered == "true"
+
+        # Plain digits and words are settled without raising: int() accepts
+        # any decimal string, and float() accepts no word but inf/nan
+        if value.isdecimal():
+            return int(value)
+        if value[0].isalpha() and lowered not in _FLOAT_WORDS:
+            return value
 
         # Try integer
         try:
@@ -194,6 +299,17 @@ class CSVIngestor:
             batch_id=batch_id
         )
 
+        # Per-file values used by every row
+        source_file = str(filepath.absolute())
+        payload_items = tuple(column_mapping.payload_columns.items())
+        mapped_columns = frozenset({
+            column_mapping.signal_type,
+            column_mapping.timestamp,
+            column_mapping.source,
+            column_mapping.reliability,
+            *column_mapping.payload_columns.values()
+        })
+
         with open(filepath, "r", newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
 
@@ -202,10 +318,12 @@ class CSVIngestor:
                     signal = self._parse_row(
                         row=row,
                         column_mapping=column_mapping,
-                        filepath=filepath,
+                        source_file=source_file,
                         row_num=row_num,
                         batch_id=batch_id,
-                        file_hash=file_hash
+                        file_hash=file_hash,
+                        payload_items=payload_items,
+                        mapped_columns=mapped_columns
                     )
                     signals.append(signal)
                 except Exception as e:
@@ -255,15 +373,23 @@ class CSVIngestor:
         self,
         row: Dict[str, str],
         column_mapping: ColumnMapping,
-        filepath: Path,
+        source_file: str,
         row_num: int,
         batch_id: str,
-        file_hash: str
+        file_hash: str,
+        payload_items: Tuple[Tuple[str, str], ...],
+        mapped_columns: FrozenSet[Optional[str]]
     ) -> IngestedSignal:
-        """Parse a single CSV row into a signal."""
+        """
+        Parse a single CSV row into a signal.
 
-        # Extract signal type
-        signal_type = row.get(column_mapping.signal_type, "").strip()
+        payload_items and mapped_columns are derived from column_mapping once
+        per file by ingest(), rather than rebuilt for every row.
+        """
+
+        # Extract signal type (interned: a file repeats a handful of types,
+        # and interned keys hit the identity fast path in policy lookups)
+        signal_type = sys.intern(row.get(column_mapping.signal_type, "").strip())
         if not signal_type:
             raise ValueError(f"Missing signal type in column '{column_mapping.signal_type}'")
 
@@ -275,7 +401,7 @@ class CSVIngestor:
             timestamp = self._parse_timestamp(timestamp_str)
 
         # Extract source
-        source = row.get(column_mapping.source, "csv_import").strip() or "csv_import"
+        source = sys.intern(row.get(column_mapping.source, "csv_import").strip() or "csv_import")
 
         # Extract reliability if configured
         reliability = 1.0
@@ -287,25 +413,18 @@ class CSVIngestor:
 
         # Build payload from configured columns
         payload: Dict[str, Any] = {}
-        for field_name, column_name in column_mapping.payload_columns.items():
+        for field_name, column_name in payload_items:
             if column_name in row:
                 payload[field_name] = self._parse_value(row[column_name])
 
         # Also include any extra columns not explicitly mapped
-        mapped_columns = {
-            column_mapping.signal_type,
-            column_mapping.timestamp,
-            column_mapping.source,
-            column_mapping.reliability,
-            *column_mapping.payload_columns.values()
-        }
         for col_name, col_value in row.items():
             if col_name not in mapped_columns and col_value:
                 payload[col_name] = self._parse_value(col_value)
 
         # Build provenance metadata
         provenance = {
-            "source_file": str(filepath.absolute()),
+            "source_file": source_file,
             "file_hash": file_hash,
             "row_number": row_num,
             "batch_id": batch_id,
@@ -343,14 +462,13 @@ class CSVIngestor:
         Returns:
             ImportBatch with database-persisted signals and deduplication stats
         """
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
         from core.models import Signal as DBSignal
         from core.models.signal import SignalReliability
 
         batch = self.ingest(filepath, column_mapping, skip_errors)
 
-        created_count = 0
-        dedupe_count = 0
-
         # Map reliability float to enum
         def get_reliability_enum(rel_float: float) -> SignalReliability:
             if rel_float >= 0.9:
@@ -362,45 +480,52 @@ class CSVIngestor:
             else:
                 return SignalReliability.UNVERIFIED
 
-        for signal in batch.signals:
-            # Compute content hash for idempotency
-            content_hash = compute_signal_content_hash(
-                pack=self.pack,
-                signal_type=signal.signal_type,
-                payload=signal.payload,
-                source=signal.source,
-                observed_at=signal.timestamp
-            )
+        # Compute content hashes for idempotency; only the first signal with
+        # a given hash is inserted
+        content_hashes = compute_signal_content_hashes(self.pack, batch.signals)
+
+        rows = []
+        batch_hashes = set()
+        for signal, content_hash in zip(batch.signals, content_hashes):
             signal.content_hash = content_hash
+            if content_hash in batch_hashes:
+                continue
+            batch_hashes.add(content_hash)
+            rows.append({
+                "id": uuid.UUID(signal.id),
+                "pack": self.pack,
+                "signal_type": signal.signal_type,
+                "source": signal.source,
+                "payload": signal.payload,
+                "observed_at": signal.timestamp,
+                "reliability": get_reliability_enum(signal.reliability),
+                "signal_metadata": signal.provenance,
+                "content_hash": content_hash,
+            })
+
+        # Insert in one statement; the unique content_hash index drops signals
+        # that already exist, and RETURNING reports the ones actually created
+        created_hashes = set()
+        if rows:
+            stmt = (
+                pg_insert(DBSignal)
+                .on_conflict_do_nothing(index_elements=[DBSignal.content_hash])
+                .returning(DBSignal.content_hash)
+            )
+            created_hashes = set(db_session.scalars(stmt, rows))
 
-            # Check for existing signal (idempotency)
-            existing = db_session.query(DBSignal).filter(
-                DBSignal.content_hash == content_hash
-            ).first()
+        created_count = len(created_hashes)
+        dedupe_count = len(batch.signals) - created_count
 
-            if existing:
-                dedupe_count += 1
-                if skip_duplicates:
+        if dedupe_count and not skip_duplicates:
+            # Report the first duplicate in file order, as a row-by-row check would
+            for signal in batch.signals:
+                if signal.content_hash in created_hashes:
+                    created_hashes.discard(signal.content_hash)
                     continue
-                else:
-                    raise ValueError(
-                        f"Duplicate signal detected: {signal.signal_type} at {signal.timestamp}"
-                    )
-
-            # Create new signal
-            db_signal = DBSignal(
-                id=uuid.UUID(signal.id),
-                pack=self.pack,
-                signal_type=signal.signal_type,
-                source=signal.source,
-                payload=signal.payload,
-                observed_at=signal.timestamp,
-                reliability=get_reliability_enum(signal.reliability),
-                signal_metadata=signal.provenance,
-                content_hash=content_hash
-            )
-            db_session.add(db_signal)
-            created_count += 1
+                raise ValueError(
+                    f"Duplicate signal detected: {signal.signal_type} at {signal.timestamp}"
+                )
 
         db_session.commit()
 
@@ -7,15 +7,65 @@ production data. Enables policy tuning and what-if analysis.
 
 import hashlib
 import json
+import sys
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from operator import eq, ge, gt, le, lt, ne
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
 from .csv_ingestor import IngestedSignal
 
 
+# Threshold comparison operators, keyed by their rule_definition spelling
+_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    ">": gt,
+    ">=": ge,
+    "<": lt,
+    "<=": le,
+    "==": eq,
+    "!=": ne,
+    "abs>": lambda actual, threshold: abs(actual) > threshold,
+    "abs>=": lambda actual, threshold: abs(actual) >= threshold,
+}
+
+
+class _CompiledCondition(NamedTuple):
+    """A threshold condition with its field paths split once per run."""
+
+    condition: Dict
+    field_keys: Tuple[str, ...]
+    field_key: Optional[str]  # Set when the field path is a single payload key
+    operator: str
+    threshold_value: Any
+    threshold_keys: Optional[Tuple[str, ...]]  # Set when the threshold references a payload field
+
+
+class _CompiledRule(NamedTuple):
+    """A threshold_breach rule with its conditions grouped by signal type."""
+
+    conditions_by_type: Dict[str, Tuple[_CompiledCondition, ...]]
+    condition_count: int
+    evaluation_logic: str
+
+
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a payload field path into its keys (the "payload." prefix is dropped)."""
+    return tuple(path.replace("payload.", "").split("."))
+
+
+def _lookup(data: Any, keys: Tuple[str, ...]) -> Any:
+    """Follow pre-split keys through nested dictionaries."""
+    value = data
+    for key in keys:
+        if isinstance(value, dict):
+            value = value.get(key)
+        else:
+            return None
+    return value
+
+
 class ReplayConfig(BaseModel):
     """Configuration for a replay run."""
 
@@ -95,18 +145,44 @@ class ReplayHarness:
             db_session: Optional SQLAlchemy session for DB operations
         """
         self.db_session = db_session
+        # id(rule_definition) -> (rule_definition, compiled rule); reset per run
+        self._compiled_rules: Dict[int, Tuple[Dict, _CompiledRule]] = {}
 
     def _compute_input_hash(self, policy_version: Dict, signal: Dict) -> str:
         """Compute deterministic hash of evaluation inputs."""
-        input_data = {
-            "policy_version_id": policy_version.get("id"),
-            "rule_definition": policy_version.get("rule_definition"),
-            "signal_type": signal.get("signal_type"),
-            "signal_payload": signal.get("payload"),
-            "signal_timestamp": signal.get("timestamp").isoformat() if isinstance(signal.get("timestamp"), datetime) else signal.get("timestamp"),
-        }
-        canonical = json.dumps(input_data, sort_keys=True, default=str)
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        digest = self._input_hash_prefix(policy_version)
+        digest.update(self._input_hash_suffix(signal))
+        return digest.hexdigest()
+
+    def _input_hash_prefix(self, policy_version: Dict):
+        """
+        Return a SHA-256 state over the policy part of the canonical input.
+
+        The canonical input is json.dumps(input_data, sort_keys=True) over
+        policy_version_id, rule_definition, signal_payload, signal_timestamp
+        and signal_type. Without indentation each value encodes the same on
+        its own, so the policy part (first in key order) is hashed once per
+        policy and the state copied per signal.
+        """
+        prefix = (
+            '{"policy_version_id": ' + json.dumps(policy_version.get("id"), default=str)
+            + ', "rule_definition": '
+            + json.dumps(policy_version.get("rule_definition"), sort_keys=True, default=str)
+            + ', "signal_payload": '
+        )
+        return hashlib.sha256(prefix.encode())
+
+    def _input_hash_suffix(self, signal: Dict) -> bytes:
+        """Encode the signal part of the canonical input (see _input_hash_prefix)."""
+        timestamp = signal.get("timestamp")
+        suffix = (
+            json.dumps(signal.get("payload"), sort_keys=True, default=str)
+            + ', "signal_timestamp": '
+            + json.dumps(timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp, default=str)
+            + ', "signal_type": ' + json.dumps(signal.get("signal_type"), default=str)
+            + "}"
+        )
+        return suffix.encode()
 
     def _compute_fingerprint(self, policy_id: str, signal_ids: List[str], context: Dict) -> str:
         """Compute exception fingerprint for deduplication."""
@@ -129,45 +205,54 @@ class ReplayHarness:
         Returns:
             Tuple of (result, severity, details)
         """
-        conditions = rule.get("conditions", [])
-        evaluation_logic = rule.get("evaluation_logic", "any_condition_met")
+        cached = self._compiled_rules.get(id(rule))
+        if cached is not None and cached[0] is rule:
+            compiled = cached[1]
+        else:
+            compiled = self._compile_rule(rule)
+
+        entries = compiled.conditions_by_type.get(signal.signal_type)
+        if entries is None:
+            # No condition applies to this signal type
+            result = "fail" if (
+                compiled.evaluation_logic != "any_condition_met" and compiled.condition_count == 0
+            ) else "pass"
+            return result, None, {
+                "condition_results": [],
+                "evaluation_logic": compiled.evaluation_logic
+            }
 
         condition_results = []
         triggered_severity = None
 
-        for condition in conditions:
-            # Check signal type match
-            if condition.get("signal_type") != signal.signal_type:
-                continue
+        payload = signal.payload
+        for entry in entries:
+            operator = entry.operator
 
-            threshold = condition.get("threshold", {})
-            field_path = threshold.get("field", "")
-            operator = threshold.get("operator", ">")
-            threshold_value = threshold.get("value")
-
-            # Get actual value from signal payload
-            actual_value = self._get_nested_value(signal.payload, field_path.replace("payload.", ""))
+            # Get actual value from signal payload (top-level keys directly)
+            if entry.field_key is not None:
+                actual_value = payload.get(entry.field_key)
+            else:
+                actual_value = _lookup(payload, entry.field_keys)
 
             # Get threshold value (could be a reference to another field)
-            if isinstance(threshold_value, str) and threshold_value.startswith("payload."):
-                threshold_value = self._get_nested_value(
-                    signal.payload,
-                    threshold_value.replace("payload.", "")
-                )
+            threshold_value = entry.threshold_value
+            if entry.threshold_keys is not None:
+                threshold_value = _lookup(payload, entry.threshold_keys)
 
             # Evaluate condition
             try:
                 breached = self._compare_values(actual_value, operator, threshold_value)
             except (TypeError, ValueError):
                 condition_results.append({
-                    "condition": condition,
+                    "condition": entry.condition,
                     "result": "inconclusive",
                     "reason": "Unable to compare values"
                 })
                 continue
 
             condition_results.append({
-                "condition": condition,
+                "condition": entry.condition,
                 "result": "breached" if breached else "ok",
                 "actual_value": actual_value,
                 "threshold_value": threshold_value,
@@ -176,7 +261,7 @@ class ReplayHarness:
 
             if breached:
                 # Determine severity from mapping
-                severity_mapping = condition.get("severity_mapping", {"default": "medium"})
+                severity_mapping = entry.condition.get("severity_mapping", {"default": "medium"})
                 triggered_severity = self._determine_severity(
                     signal.payload,
                     severity_mapping
@@ -188,52 +273,75 @@ class ReplayHarness:
 
         if inconclusive_conditions and not breached_conditions:
             result = "inconclusive"
-        elif evaluation_logic == "any_condition_met":
+        elif compiled.evaluation_logic == "any_condition_met":
             result = "fail" if breached_conditions else "pass"
         else:  # all_conditions_met
-            result = "fail" if len(breached_conditions) == len(conditions) else "pass"
+            result = "fail" if len(breached_conditions) == compiled.condition_count else "pass"
 
         details = {
             "condition_results": condition_results,
-            "evaluation_logic": evaluation_logic
+            "evaluation_logic": compiled.evaluation_logic
         }
 
         return result, triggered_severity, details
 
+    def _compile_rule(self, rule: Dict) -> _CompiledRule:
+        """
+        Return the compiled form of a threshold_breach rule.
+
+        Field paths are split and conditions grouped by signal type once per
+        rule, so evaluating a signal only visits the conditions for its type.
+        Compiled rules are cached by identity for the duration of a run.
+        """
+        conditions = rule.get("conditions", [])
+        conditions_by_type: Dict[str, List[_CompiledCondition]] = {}
+        for condition in conditions:
+            threshold = condition.get("threshold", {})
+            threshold_value = threshold.get("value")
+            threshold_keys = None
+            if isinstance(threshold_value, str) and threshold_value.startswith("payload."):
+                threshold_keys = _split_path(threshold_value)
+            signal_type = condition.get("signal_type")
+            if type(signal_type) is str:
+                # Rules loaded from the database carry fresh strings; interned
+                # keys match ingested signal types by identity
+                signal_type = sys.intern(signal_type)
+            field_keys = _split_path(threshold.get("field", ""))
+            conditions_by_type.setdefault(signal_type, []).append(
+                _CompiledCondition(
+                    condition=condition,
+                    field_keys=field_keys,
+                    field_key=field_keys[0] if len(field_keys) == 1 else None,
+                    operator=threshold.get("operator", ">"),
+                    threshold_value=threshold_value,
+                    threshold_keys=threshold_keys,
+                )
+            )
+
+        compiled = _CompiledRule(
+            conditions_by_type={
+                signal_type: tuple(entries)
+                for signal_type, entries in conditions_by_type.items()
+            },
+            condition_count=len(conditions),
+            evaluation_logic=rule.get("evaluation_logic", "any_condition_met"),
+        )
+        self._compiled_rules[id(rule)] = (rule, compiled)
+        return compiled
+
     def _get_nested_value(self, data: Dict, path: str) -> Any:
         """Get a nested value from a dictionary using dot notation."""
-        keys = path.split(".")
-        value = data
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key)
-            else:
-                return None
-        return value
+        return _lookup(data, tuple(path.split(".")))
 
     def _compare_values(self, actual: Any, operator: str, threshold: Any) -> bool:
         """Compare values using the specified operator."""
         if actual is None or threshold is None:
             raise ValueError("Cannot compare None values")
 
-        if operator == ">":
-            return actual > threshold
-        elif operator == ">=":
-            return actual >= threshold
-        elif operator == "<":
-            return actual < threshold
-        elif operator == "<=":
-            return actual <= threshold
-        elif operator == "==":
-            return actual == threshold
-        elif operator == "!=":
-            return actual != threshold
-        elif operator == "abs>":
-            return abs(actual) > threshold
-        elif operator == "abs>=":
-            return abs(actual) >= threshold
-        else:
+        compare = _OPERATORS.get(operator)
+        if compare is None:
             raise ValueError(f"Unknown operator: {operator}")
+        return compare(actual, threshold)
 
     def _determine_severity(self, payload: Dict, severity_mapping: Dict) -> str:
         """Determine severity based on payload values and mapping rules."""
@@ -259,6 +367,7 @@ class ReplayHarness:
             ReplayResult with all evaluations and metrics
         """
         config = config or ReplayConfig()
+        self._compiled_rules = {}
         result = ReplayResult(
             namespace=config.namespace,
             config=config
@@ -274,14 +383,41 @@ class ReplayHarness:
         result.signals_processed = len(filtered_signals)
         seen_fingerprints = set()
 
+        # Skip policies excluded by the policy_ids filter, and hash each
+        # policy's part of the evaluation input once for the whole run.
+        # An input that cannot be encoded is kept as its exception and
+        # recorded per (signal, policy) pair below, as if hashed per pair.
+        if config.policy_ids:
+            policies = [p for p in policies if p.get("id") in config.policy_ids]
+        hash_prefixes = []
+        for policy in policies:
+            try:
+                hash_prefixes.append(self._input_hash_prefix(policy.get("current_version", policy)))
+            except Exception as e:
+                hash_prefixes.append(e)
+
         for signal in filtered_signals:
-            for policy in policies:
-                # Skip if policy_ids filter is set and this policy isn't included
-                if config.policy_ids and policy.get("id") not in config.policy_ids:
+            try:
+                hash_suffix = self._input_hash_suffix(signal.model_dump())
+            except Exception as e:
+                hash_suffix = e
+            for policy, hash_prefix in zip(policies, hash_prefixes):
+                hash_error = next(
+                    (part for part in (hash_prefix, hash_suffix) if isinstance(part, Exception)),
+                    None
+                )
+                if hash_error is not None:
+                    result.errors.append({
+                        "signal_id": signal.id,
+                        "policy_id": policy.get("id"),
+                        "error": str(hash_error)
+                    })
                     continue
 
                 try:
-                    eval_result = self._evaluate_signal(signal, policy)
+                    digest = hash_prefix.copy()
+                    digest.update(hash_suffix)
+                    eval_result = self._evaluate_signal(signal, policy, digest.hexdigest())
                     result.evaluations.append(eval_result)
 
                     # Update metrics
@@ -317,17 +453,19 @@ class ReplayHarness:
     def _evaluate_signal(
         self,
         signal: IngestedSignal,
-        policy: Dict
+        policy: Dict,
+        input_hash: Optional[str] = None
     ) -> EvaluationResult:
         """Evaluate a single signal against a policy."""
         policy_version = policy.get("current_version", policy)
         rule_definition = policy_version.get("rule_definition", {})
         rule_type = rule_definition.get("type", "threshold_breach")
 
-        input_hash = self._compute_input_hash(
-            policy_version,
-            signal.model_dump()
-        )
+        if input_hash is None:
+            input_hash = self._compute_input_hash(
+                policy_version,
+                signal.model_dump()
+            )
 
         if rule_type == "threshold_breach":
             result, severity, details = self._evaluate_threshold_breach(
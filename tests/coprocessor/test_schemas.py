@@ -10,6 +10,8 @@ from coprocessor.schemas.narrative import (
     EvidenceReference,
     NarrativeClaim,
     MemoSection,
+    MemoTemplate,
+    MemoTemplateConfig,
     NarrativeMemo,
     NarrativeValidationResult,
 )
@@ -343,3 +345,62 @@ class TestNarrativeValidationResult:
 
         assert result.is_valid is True
         assert result.error_count == 0
+
+
+class TestMemoTemplate:
+    """Tests for MemoTemplate enum."""
+
+    def test_hashes_as_its_string_value(self):
+        """Test that members and raw string values are interchangeable dict keys."""
+        templates = {template: template.value for template in MemoTemplate}
+
+        assert templates["treasury_position"] == "treasury_position"
+        assert hash(MemoTemplate.TREASURY_POSITION) == hash("treasury_position")
+
+    def test_serializes_as_string(self):
+        """Test that templates round-trip through their string values."""
+        assert MemoTemplate("wealth_client") is MemoTemplate.WEALTH_CLIENT
+        assert MemoTemplate.WEALTH_CLIENT == "wealth_client"
+
+
+class TestMemoTemplateConfig:
+    """Tests for MemoTemplateConfig schema."""
+
+    def test_string_lists_become_interned_tuples(self):
+        """Test that list input is stored as a tuple of interned strings."""
+        import sys
+
+        config = MemoTemplateConfig(
+            template_id=MemoTemplate.DECISION_BRIEF,
+            name="Decision Brief",
+            description="Standard decision documentation memo",
+            required_sections=["Situation", "".join(["Deci", "sion"])],
+            focus_areas=["What triggered the exception"],
+        )
+
+        assert config.required_sections == ("Situation", "Decision")
+        assert config.required_sections[1] is sys.intern("Decision")
+        assert config.vocabulary_hints == ()
+        assert config.model_dump(mode="json")["focus_areas"] == ["What triggered the exception"]
+
+    def test_config_is_frozen(self):
+        """Test that shared template configs cannot be mutated in place."""
+        config = MemoTemplateConfig(
+            template_id=MemoTemplate.DECISION_BRIEF,
+            name="Decision Brief",
+            description="Standard decision documentation memo",
+        )
+
+        with pytest.raises(ValidationError):
+            config.max_sections = 99
+
+    def test_config_hashes_by_template_id(self):
+        """Test that configs are hashable despite dict-valued fields."""
+        config = MemoTemplateConfig(
+            template_id=MemoTemplate.DECISION_BRIEF,
+            name="Decision Brief",
+            description="Standard decision documentation memo",
+        )
+
+        assert hash(config) == hash(MemoTemplate.DECISION_BRIEF)
+        assert {config: 1}[config.model_copy()] == 1
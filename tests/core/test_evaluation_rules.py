@@ -0,0 +1,30 @@
+"""
+Tests for policy evaluation rule helpers.
+"""
+
+
+class TestExtractFieldValue:
+    """Tests for dotted field path extraction."""
+
+    def test_nested_and_missing_fields(self):
+        """Test that nested fields resolve and missing ones return None."""
+        from core.domain.evaluation_rules import _extract_field_value
+
+        signal = {"payload": {"current_position": 120, "limit": 100}}
+
+        assert _extract_field_value(signal, "payload.current_position") == 120
+        assert _extract_field_value(signal, "payload.missing") is None
+        assert _extract_field_value(signal, "payload.current_position.deeper") is None
+
+    def test_field_paths_split_once(self):
+        """Test that repeated paths reuse the cached split."""
+        from core.domain.evaluation_rules import _extract_field_value, _split_field_path
+
+        _split_field_path.cache_clear()
+        for position in range(5):
+            _extract_field_value({"payload": {"current_position": position}}, "payload.current_position")
+
+        info = _split_field_path.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+        assert _split_field_path("payload.limit") == ("payload", "limit")
@@ -0,0 +1,38 @@
+"""
+Tests for exception fingerprint stability.
+"""
+
+from uuid import UUID
+
+
+class TestExceptionFingerprint:
+    """Tests for compute_exception_fingerprint."""
+
+    def test_fingerprint_is_pinned(self):
+        """Test that the fingerprint encoding stays byte-for-byte stable.
+
+        Fingerprints are stored on Exception rows and matched against new
+        ones, so any change to the canonical form or hash would stop
+        duplicates from being recognised across a deploy.
+        """
+        from core.domain.fingerprinting import compute_exception_fingerprint
+
+        fingerprint = compute_exception_fingerprint(
+            UUID("12345678-1234-5678-1234-567812345678"),
+            "threshold_breach",
+            {"asset": "BTC", "signal_type": "position_limit_breach"},
+        )
+
+        assert fingerprint == "0956cf0ae1dfd353b2d1b292652b88961d581b2071fd3c5cdc2c90f62933419f"
+
+    def test_fingerprint_ignores_key_order(self):
+        """Test that key dimension order does not change the fingerprint."""
+        from core.domain.fingerprinting import compute_exception_fingerprint
+
+        policy_id = UUID("12345678-1234-5678-1234-567812345678")
+
+        assert compute_exception_fingerprint(
+            policy_id, "threshold_breach", {"client_id": "C1", "portfolio_id": "P1"}
+        ) == compute_exception_fingerprint(
+            policy_id, "threshold_breach", {"portfolio_id": "P1", "client_id": "C1"}
+        )
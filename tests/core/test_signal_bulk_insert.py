@@ -0,0 +1,28 @@
+"""
+Tests for the bulk signal INSERT helper.
+"""
+
+from unittest.mock import MagicMock
+
+from core.models.signal import bulk_create_signals
+
+
+class TestBulkCreateSignals:
+    """Tests for bulk_create_signals helper."""
+
+    def test_single_execute_on_caller_session(self):
+        """All rows go through one executemany on the caller's session."""
+        db = MagicMock()
+        rows = [{"signal_type": "a"}, {"signal_type": "b"}, {"signal_type": "c"}]
+
+        assert bulk_create_signals(rows, db=db) == 3
+        db.execute.assert_called_once()
+        assert db.execute.call_args[0][1] == rows
+        db.commit.assert_not_called()
+
+    def test_empty_rows_skip_database(self):
+        """No rows means no statement."""
+        db = MagicMock()
+
+        assert bulk_create_signals([], db=db) == 0
+        db.execute.assert_not_called()
@@ -0,0 +1,79 @@
+"""
+Tests for signal payload validation against pack schemas.
+"""
+
+import pytest
+
+
+class TestCompiledPayloadValidation:
+    """Tests for the compiled payload fast path."""
+
+    @pytest.fixture
+    def validator(self):
+        """Create a fresh validator."""
+        from core.validation.signal_validator import SignalValidator
+        return SignalValidator()
+
+    @pytest.fixture
+    def payload(self):
+        """Valid position_limit_breach payload."""
+        return {"asset": "BTC", "current_position": 120, "limit": 100, "duration_hours": 2.5}
+
+    def test_valid_payload_passes(self, validator, payload):
+        """Test that a valid payload (with extra fields) passes."""
+        assert validator.validate("treasury", "position_limit_breach", {**payload, "note": "x"}) == (True, [])
+
+    @pytest.mark.parametrize("override", [
+        {"limit": True},
+        {"limit": None},
+        {"limit": "100"},
+        {"asset": 1},
+    ])
+    def test_compiled_path_matches_python_path(self, validator, payload, override):
+        """Test that invalid payloads report the same errors as the Python checks."""
+        bad = {**payload, **override}
+        schema = validator._pack_schemas["treasury"]["position_limit_breach"]["payload_schema"]
+
+        is_valid, errors = validator.validate("treasury", "position_limit_breach", bad)
+
+        assert is_valid is False
+        assert errors == validator._validate_payload(bad, schema)
+
+    def test_missing_field_and_non_object(self, validator, payload):
+        """Test missing fields and non-object payloads are rejected."""
+        del payload["limit"]
+
+        assert validator.validate("treasury", "position_limit_breach", payload)[0] is False
+        assert validator.validate("treasury", "position_limit_breach", [payload])[1] == [
+            {"field": "payload", "message": "Payload must be an object"}
+        ]
+
+    def test_validator_compiled_once_per_signal_type(self, validator, payload):
+        """Test that the compiled validator is cached per (pack, signal_type)."""
+        validator.validate("treasury", "position_limit_breach", payload)
+        compiled = validator._payload_validators[("treasury", "position_limit_breach")]
+        validator.validate("treasury", "position_limit_breach", payload)
+
+        assert compiled is not None
+        assert validator._payload_validators[("treasury", "position_limit_breach")] is compiled
+
+    def test_unknown_schema_type_falls_back(self):
+        """Test that schemas with uncompiled types skip the fast path."""
+        from core.validation.signal_validator import _compile_payload_schema
+
+        assert _compile_payload_schema({"when": "datetime"}) is None
+
+
+class TestPackPayloadSchemas:
+    """Tests for pack payload_schema definitions."""
+
+    def test_schema_type_tags_are_known(self):
+        """Test that every payload field type has a validator (unknown tags accept anything)."""
+        from core.validation.signal_validator import TYPE_VALIDATORS
+        from packs.treasury.signal_types import TREASURY_SIGNAL_TYPES
+        from packs.wealth.signal_types import WEALTH_SIGNAL_TYPES
+
+        for registry in (TREASURY_SIGNAL_TYPES, WEALTH_SIGNAL_TYPES):
+            for signal_type, definition in registry.items():
+                for field_name, field_type in definition.get("payload_schema", {}).items():
+                    assert field_type in TYPE_VALIDATORS, f"{signal_type}.{field_name}: {field_type}"
@@ -6,9 +6,11 @@ the tool logic, not database connectivity.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, PropertyMock
 from datetime import datetime
 
+from core.models import AuditEventType, ExceptionSeverity, ExceptionStatus, SignalReliability
+
 # Skip all tests in this module if mcp library is not installed
 try:
     import mcp
@@ -55,8 +57,8 @@ class TestGetOpenExceptions:
         mock_exception = Mock()
         mock_exception.id = "exc-001"
         mock_exception.title = "Test Exception"
-        mock_exception.severity = Mock(value="high")
-        mock_exception.status = Mock(value="open")
+        mock_exception.severity = ExceptionSeverity.HIGH
+        mock_exception.status = ExceptionStatus.OPEN
         mock_exception.raised_at = datetime(2025, 1, 15, 10, 0, 0)
         mock_exception.context = {"asset": "BTC"}
         mock_exception.policy_id = "policy-001"
@@ -66,7 +68,7 @@ class TestGetOpenExceptions:
         mock_query.filter.return_value = mock_query
         mock_query.order_by.return_value = mock_query
         mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = [mock_exception]
+        mock_query.yield_per.return_value = [mock_exception]
 
         result = get_open_exceptions()
 
@@ -87,7 +89,7 @@ class TestGetOpenExceptions:
         mock_query.filter.return_value = mock_query
         mock_query.order_by.return_value = mock_query
         mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = []
+        mock_query.yield_per.return_value = []
 
         result = get_open_exceptions(severity="critical", limit=10)
 
@@ -108,6 +110,80 @@ class TestGetOpenExceptions:
         assert "error" in result[0]
 
 
+class TestGetOpenExceptionsPage:
+    """Tests for get_open_exceptions_page tool."""
+
+    def _mock_exception(self, exc_id, raised_at):
+        exc = Mock()
+        exc.id = exc_id
+        exc.title = f"Exception {exc_id}"
+        exc.severity = ExceptionSeverity.HIGH
+        exc.status = ExceptionStatus.OPEN
+        exc.raised_at = raised_at
+        exc.context = {}
+        return exc
+
+    @patch('mcp_server.server.get_db_session')
+    def test_page_returns_next_cursor_when_more_rows(self, mock_get_session):
+        """Test that a full page yields a cursor pointing at its last row."""
+        from mcp_server.server import get_open_exceptions_page
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        rows = [
+            self._mock_exception("00000000-0000-0000-0000-00000000000%d" % i, datetime(2025, 1, 15, 10 - i))
+            for i in range(3)
+        ]
+
+        mock_query = mock_session.query.return_value
+        mock_query.filter.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+        mock_query.limit.return_value = mock_query
+        mock_query.yield_per.return_value = rows
+
+        result = get_open_exceptions_page(limit=2)
+
+        assert len(result["exceptions"]) == 2
+        mock_query.limit.assert_called_with(3)
+        assert result["next_cursor"] == (
+            "2025-01-15T09:00:00|00000000-0000-0000-0000-000000000001"
+        )
+
+    @patch('mcp_server.server.get_db_session')
+    def test_last_page_has_no_cursor(self, mock_get_session):
+        """Test that a short page ends pagination."""
+        from mcp_server.server import get_open_exceptions_page
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        mock_query = mock_session.query.return_value
+        mock_query.filter.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+        mock_query.limit.return_value = mock_query
+        mock_query.yield_per.return_value = [
+            self._mock_exception("00000000-0000-0000-0000-000000000001", datetime(2025, 1, 15))
+        ]
+
+        result = get_open_exceptions_page(
+            cursor="2025-01-16T00:00:00|00000000-0000-0000-0000-000000000009",
+            limit=2,
+        )
+
+        assert len(result["exceptions"]) == 1
+        assert result["next_cursor"] is None
+
+    def test_invalid_cursor_returns_error(self):
+        """Test that a malformed cursor is reported, not raised."""
+        from mcp_server.server import get_open_exceptions_page
+
+        with patch('mcp_server.server.get_db_session'):
+            result = get_open_exceptions_page(cursor="garbage")
+
+        assert "error" in result
+
+
 class TestGetExceptionDetail:
     """Tests for get_exception_detail tool."""
 
@@ -132,70 +208,122 @@ class TestGetPolicies:
     @patch('mcp_server.server.get_db_session')
     def test_get_policies_basic(self, mock_get_session):
         """Test basic policy retrieval."""
+        from core.models import Policy, PolicyVersion
         from mcp_server.server import get_policies
 
         mock_session = MagicMock()
         mock_get_session.return_value = mock_session
 
-        # Mock policy
-        mock_policy = Mock()
+        # Mock policy (spec'd so only real model attributes can be read)
+        mock_policy = Mock(spec=Policy)
         mock_policy.id = "policy-001"
         mock_policy.name = "Position Limit Policy"
         mock_policy.description = "Test policy"
-        mock_policy.is_active = True
         mock_policy.created_at = datetime(2025, 1, 1)
 
         # Mock version
-        mock_version = Mock()
+        mock_version = Mock(spec=PolicyVersion)
         mock_version.id = "version-001"
         mock_version.version_number = 1
         mock_version.rule_definition = {"type": "threshold_breach"}
-        mock_version.effective_from = datetime(2025, 1, 1)
+        mock_version.valid_from = datetime(2025, 1, 1)
 
         # Setup queries
         mock_query = mock_session.query.return_value
+        mock_query.options.return_value = mock_query
         mock_query.filter.return_value = mock_query
-        mock_query.all.return_value = [mock_policy]
-        mock_query.first.return_value = mock_version
+        mock_query.yield_per.return_value = [mock_policy]
+        mock_policy.current_version = mock_version
 
         result = get_policies()
 
         assert len(result) == 1
         assert result[0]["id"] == "policy-001"
         assert result[0]["name"] == "Position Limit Policy"
+        assert result[0]["is_active"] is True
+        assert result[0]["current_version"]["effective_from"] == "2025-01-01T00:00:00"
+        mock_query.filter.assert_called_once()
 
     @patch('mcp_server.server.get_db_session')
     def test_get_policies_with_versions(self, mock_get_session):
         """Test policy retrieval with version history."""
+        from core.models import Policy, PolicyVersion
         from mcp_server.server import get_policies
 
         mock_session = MagicMock()
         mock_get_session.return_value = mock_session
 
-        mock_policy = Mock()
+        mock_policy = Mock(spec=Policy)
         mock_policy.id = "policy-001"
         mock_policy.name = "Test Policy"
         mock_policy.description = "Test"
-        mock_policy.is_active = True
         mock_policy.created_at = datetime(2025, 1, 1)
 
-        mock_version = Mock()
-        mock_version.id = "v1"
-        mock_version.version_number = 1
-        mock_version.is_current = True
+        mock_version = Mock(spec=PolicyVersion)
+        mock_version.id = "v2"
+        mock_version.version_number = 2
         mock_version.rule_definition = {}
-        mock_version.effective_from = datetime(2025, 1, 1)
-        mock_version.change_reason = "Initial"
+        mock_version.valid_from = datetime(2025, 2, 1)
+        mock_version.changelog = "Raise limit"
+
+        old_version = Mock(spec=PolicyVersion)
+        old_version.id = "v1"
+        old_version.version_number = 1
+        old_version.valid_from = datetime(2025, 1, 1)
+        old_version.changelog = "Initial"
 
         mock_query = mock_session.query.return_value
+        mock_query.options.return_value = mock_query
         mock_query.filter.return_value = mock_query
         mock_query.order_by.return_value = mock_query
-        mock_query.all.side_effect = [[mock_policy], [mock_version]]
-        mock_query.first.return_value = mock_version
+        mock_query.yield_per.return_value = [mock_policy]
+        mock_query.all.return_value = [mock_version, old_version]
+        mock_policy.current_version = mock_version
 
         result = get_policies(include_versions=True)
 
         assert len(result) == 1
+        versions = result[0]["versions"]
+        assert [v["id"] for v in versions] == ["v2", "v1"]
+        assert [v["is_current"] for v in versions] == [True, False]
+        assert versions[1]["change_reason"] == "Initial"
+
+    @patch('mcp_server.server.get_db_session')
+    def test_get_policies_inactive_included(self, mock_get_session):
+        """Test that is_active=False skips the filter and reports policies without a current version."""
+        from core.models import Policy
+        from mcp_server.server import get_policies
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        mock_policy = Mock(spec=Policy)
+        mock_policy.id = "policy-002"
+        mock_policy.name = "Retired Policy"
+        mock_policy.description = None
+        mock_policy.created_at = datetime(2025, 1, 1)
+        mock_policy.current_version = None
+
+        mock_query = mock_session.query.return_value
+        mock_query.options.return_value = mock_query
+        mock_query.yield_per.return_value = [mock_policy]
+
+        result = get_policies(is_active=False)
+
+        assert result[0]["is_active"] is False
+        assert "current_version" not in result[0]
+        mock_query.filter.assert_not_called()
+
+    def test_active_filter_uses_current_version(self):
+        """Test that the active filter is an EXISTS on the current-version relationship."""
+        from sqlalchemy.dialects import postgresql
+
+        from core.models import Policy
+
+        sql = str(Policy.current_version.has().compile(dialect=postgresql.dialect()))
+
+        assert "EXISTS" in sql
+        assert "policy_versions.valid_to IS NULL" in sql
 
 
 class TestGetEvidencePack:
@@ -208,7 +336,8 @@ class TestGetEvidencePack:
 
         mock_session = MagicMock()
         mock_get_session.return_value = mock_session
-        mock_session.query.return_value.filter.return_value.first.return_value = None
+        mock_query = mock_session.query.return_value
+        mock_query.options.return_value.filter.return_value.first.return_value = None
 
         result = get_evidence_pack("nonexistent-id")
 
@@ -234,8 +363,7 @@ class TestGetEvidencePack:
         mock_decision.exception_id = None
 
         mock_query = mock_session.query.return_value
-        mock_query.filter.return_value.first.return_value = mock_decision
-        mock_query.filter.return_value.order_by.return_value.all.return_value = []
+        mock_query.options.return_value.filter.return_value.first.return_value = mock_decision
 
         result = get_evidence_pack("dec-001")
 
@@ -243,42 +371,297 @@ class TestGetEvidencePack:
         assert "decision" in result
         assert "evidence_items" in result
         assert result["decision"]["id"] == "dec-001"
+        assert result["audit_trail"] == []
+        assert result["audit_trail_cursor"] is None
+        # One eager-loaded decision query plus one audit trail query
+        assert mock_session.query.call_count == 2
 
+    @patch('mcp_server.server.get_db_session')
+    def test_get_evidence_pack_caps_audit_trail(self, mock_get_session):
+        """Long audit trails are cut at the inline limit with a cursor."""
+        from mcp_server.server import get_evidence_pack, AUDIT_TRAIL_INLINE_LIMIT
 
-class TestSearchDecisions:
-    """Tests for search_decisions tool."""
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
 
+        mock_decision = Mock()
+        mock_decision.id = "dec-001"
+        mock_decision.decided_at = datetime(2025, 1, 15)
+        mock_decision.decided_by = "user@example.com"
+        mock_decision.rationale = "Test rationale"
+        mock_decision.assumptions = None
+        mock_decision.exception_id = None
+
+        events = []
+        for i in range(AUDIT_TRAIL_INLINE_LIMIT + 1):
+            event = Mock()
+            event.id = f"00000000-0000-0000-0000-{i:012d}"
+            event.event_type = AuditEventType.DECISION_RECORDED
+            event.occurred_at = datetime(2025, 1, 15, 10, 0, 0)
+            event.actor = "system"
+            event.event_data = {}
+            events.append(event)
+
+        mock_query = mock_session.query.return_value
+        mock_query.options.return_value.filter.return_value.first.return_value = mock_decision
+        audit_query = mock_query.filter.return_value.order_by.return_value
+        audit_query.limit.return_value.yield_per.return_value = events
+
+        result = get_evidence_pack("dec-001")
+
+        assert len(result["audit_trail"]) == AUDIT_TRAIL_INLINE_LIMIT
+        audit_query.limit.assert_called_once_with(AUDIT_TRAIL_INLINE_LIMIT + 1)
+        last = result["audit_trail"][-1]
+        assert result["audit_trail_cursor"] == f"{last['timestamp']}|{last['id']}"
+
+
+class TestEvidencePackSections:
+    """Tests for get_evidence_pack include filtering."""
+
+    @patch('mcp_server.server._get_evidence_cache')
     @patch('mcp_server.server.get_db_session')
-    def test_search_decisions_basic(self, mock_get_session):
-        """Test basic decision search."""
-        from mcp_server.server import search_decisions
+    def test_audit_only_skips_evaluation_and_cache(self, mock_get_session, mock_get_cache):
+        """Requesting only the audit trail never touches the evaluation chain."""
+        from mcp_server.server import get_evidence_pack
 
         mock_session = MagicMock()
         mock_get_session.return_value = mock_session
 
+        mock_exception = Mock()
+        mock_exception.id = "exc-001"
+        mock_exception.title = "Position limit breach"
+        mock_exception.severity = ExceptionSeverity.HIGH
+        mock_exception.context = {"asset": "BTC"}
+        mock_exception.raised_at = datetime(2025, 1, 15)
+        mock_exception.options = []
+        mock_exception.evaluation_id = "eval-001"
+        type(mock_exception).evaluation = PropertyMock(side_effect=AssertionError("evaluation loaded"))
+
         mock_decision = Mock()
         mock_decision.id = "dec-001"
         mock_decision.decided_at = datetime(2025, 1, 15)
         mock_decision.decided_by = "user@example.com"
         mock_decision.rationale = "Test rationale"
+        mock_decision.assumptions = None
+        mock_decision.chosen_option_id = None
         mock_decision.exception_id = "exc-001"
+        mock_decision.exception = mock_exception
 
-        mock_exception = Mock()
-        mock_exception.id = "exc-001"
-        mock_exception.title = "Test Exception"
-        mock_exception.severity = Mock(value="high")
+        mock_query = mock_session.query.return_value
+        mock_query.options.return_value.filter.return_value.first.return_value = mock_decision
+
+        result = get_evidence_pack("dec-001", include=["audit"])
+
+        assert result["exception"]["id"] == "exc-001"
+        assert "evaluation" not in result
+        assert "policy" not in result
+        assert result["audit_trail"] == []
+        mock_get_cache.assert_not_called()
+
+    def test_unknown_section_rejected(self):
+        """Unknown section names are reported instead of silently ignored."""
+        from mcp_server.server import get_evidence_pack
+
+        result = get_evidence_pack("dec-001", include=["signals", "memos"])
+
+        assert result == {"error": "Unknown evidence pack sections: memos"}
+
+
+class TestGetAuditTrailPage:
+    """Tests for get_audit_trail_page tool."""
+
+    @patch('mcp_server.server.get_db_session')
+    def test_cursor_applies_keyset_filter(self, mock_get_session):
+        """A cursor resumes strictly after the last event seen."""
+        from mcp_server.server import get_audit_trail_page
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+        base_query = mock_session.query.return_value.filter.return_value.order_by.return_value
+        base_query.filter.return_value.limit.return_value.yield_per.return_value = []
+
+        result = get_audit_trail_page(
+            "dec-001",
+            cursor="2025-01-15T10:00:00|00000000-0000-0000-0000-000000000001",
+        )
+
+        assert result == {"audit_trail": [], "next_cursor": None}
+        base_query.filter.assert_called_once()
+        base_query.filter.return_value.limit.assert_called_once_with(201)
+
+    @patch('mcp_server.server.get_db_session')
+    def test_invalid_cursor_returns_error(self, mock_get_session):
+        """A malformed cursor is reported, not raised."""
+        from mcp_server.server import get_audit_trail_page
+
+        mock_get_session.return_value = MagicMock()
+
+        result = get_audit_trail_page("dec-001", cursor="garbage")
+
+        assert "error" in result
+
+
+class TestEvidencePackCache:
+    """Tests for the optional evidence-pack cache."""
+
+    @patch('mcp_server.server.get_db_session')
+    @patch('mcp_server.server._get_evidence_cache')
+    def test_cache_hit_reads_only_audit_trail(self, mock_get_cache, mock_get_session):
+        """A cached pack skips the decision query but its audit trail is read live."""
+        import json
+        from mcp_server.server import get_evidence_pack
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = json.dumps({"evidence_pack_id": "evp_dec-001"})
+        mock_get_cache.return_value = mock_cache
+
+        event = Mock()
+        event.id = "00000000-0000-0000-0000-000000000001"
+        event.event_type = AuditEventType.DECISION_RECORDED
+        event.occurred_at = datetime(2025, 1, 16)
+        event.actor = "reviewer@example.com"
+        event.event_data = {}
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+        audit_query = mock_session.query.return_value.filter.return_value.order_by.return_value
+        audit_query.limit.return_value.yield_per.return_value = [event]
+
+        result = get_evidence_pack("dec-001")
+
+        assert result["evidence_pack_id"] == "evp_dec-001"
+        assert [e["actor"] for e in result["audit_trail"]] == ["reviewer@example.com"]
+        mock_cache.get.assert_called_once_with("evp_v4:dec-001")
+        mock_session.query.return_value.options.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+    @patch('mcp_server.server.get_db_session')
+    @patch('mcp_server.server._get_evidence_cache')
+    def test_cache_hit_without_audit_runs_no_query(self, mock_get_cache, mock_get_session):
+        """A cached pack requested without the audit section needs no query at all."""
+        import json
+        from mcp_server.server import get_evidence_pack
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = json.dumps({"evidence_pack_id": "evp_dec-001"})
+        mock_get_cache.return_value = mock_cache
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        result = get_evidence_pack("dec-001", include=["signals", "evaluation", "policy"])
+
+        assert result == {"evidence_pack_id": "evp_dec-001"}
+        mock_session.query.assert_not_called()
+
+    @patch('mcp_server.server.get_db_session')
+    @patch('mcp_server.server._get_evidence_cache')
+    def test_cache_miss_stores_pack_without_audit_trail(self, mock_get_cache, mock_get_session):
+        """A freshly built pack is cached with a TTL, minus its audit trail."""
+        from mcp_server.server import get_evidence_pack, EVIDENCE_CACHE_TTL_SECONDS
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+        mock_get_cache.return_value = mock_cache
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        mock_decision = Mock()
+        mock_decision.id = "dec-001"
+        mock_decision.decided_at = datetime(2025, 1, 15)
+        mock_decision.decided_by = "user@example.com"
+        mock_decision.rationale = "Test rationale"
+        mock_decision.assumptions = None
+        mock_decision.exception_id = None
+
+        mock_query = mock_session.query.return_value
+        mock_query.options.return_value.filter.return_value.first.return_value = mock_decision
+
+        result = get_evidence_pack("dec-001")
+
+        assert result["decision"]["id"] == "dec-001"
+        assert result["audit_trail"] == []
+        args, kwargs = mock_cache.set.call_args
+        assert args[0] == "evp_v4:dec-001"
+        assert b"audit_trail" not in args[1]
+        assert kwargs["ex"] == EVIDENCE_CACHE_TTL_SECONDS
+
+    @patch('mcp_server.server._get_evidence_cache')
+    def test_cache_errors_are_ignored(self, mock_get_cache):
+        """A failing cache behaves like a miss."""
+        from mcp_server.server import _load_cached_evidence_pack
+
+        mock_cache = MagicMock()
+        mock_cache.get.side_effect = ConnectionError("redis down")
+        mock_get_cache.return_value = mock_cache
+
+        assert _load_cached_evidence_pack("dec-001") is None
+
+
+class TestSearchDecisions:
+    """Tests for search_decisions tool."""
+
+    @patch('mcp_server.server.get_db_session')
+    def test_search_decisions_basic(self, mock_get_session):
+        """Test basic decision search."""
+        from mcp_server.server import search_decisions
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        mock_row = Mock()
+        mock_row.id = "dec-001"
+        mock_row.decided_at = datetime(2025, 1, 15)
+        mock_row.decided_by = "user@example.com"
+        mock_row.rationale_head = "Test rationale"
+        mock_row.rationale_len = 14
+        mock_row.exception_id = "exc-001"
+        mock_row.exception_title = "Test Exception"
+        mock_row.exception_severity = ExceptionSeverity.HIGH
 
         mock_query = mock_session.query.return_value
+        mock_query.join.return_value = mock_query
         mock_query.filter.return_value = mock_query
         mock_query.order_by.return_value = mock_query
         mock_query.limit.return_value = mock_query
-        mock_query.all.return_value = [mock_decision]
-        mock_query.first.return_value = mock_exception
+        mock_query.all.return_value = [mock_row]
 
         result = search_decisions()
 
         assert len(result) == 1
         assert result[0]["id"] == "dec-001"
+        assert result[0]["rationale"] == "Test rationale"
+        assert result[0]["exception"]["severity"] == "high"
+        # Exceptions come from the joined decision query, not one query per row
+        assert mock_session.query.call_count == 1
+
+    @patch('mcp_server.server.get_db_session')
+    def test_search_decisions_marks_truncated_rationale(self, mock_get_session):
+        """Test that rationale longer than the preview gets an ellipsis."""
+        from mcp_server.server import search_decisions, RATIONALE_PREVIEW_CHARS
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        mock_row = Mock()
+        mock_row.id = "dec-001"
+        mock_row.decided_at = datetime(2025, 1, 15)
+        mock_row.decided_by = "user@example.com"
+        mock_row.rationale_head = "x" * RATIONALE_PREVIEW_CHARS
+        mock_row.rationale_len = 5000
+        mock_row.exception_id = "exc-001"
+        mock_row.exception_title = "Test Exception"
+        mock_row.exception_severity = ExceptionSeverity.HIGH
+
+        mock_query = mock_session.query.return_value
+        mock_query.join.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+        mock_query.limit.return_value = mock_query
+        mock_query.all.return_value = [mock_row]
+
+        result = search_decisions()
+
+        assert result[0]["rationale"] == "x" * RATIONALE_PREVIEW_CHARS + "..."
 
     @patch('mcp_server.server.get_db_session')
     def test_search_decisions_with_date_filter(self, mock_get_session):
@@ -289,6 +672,7 @@ class TestSearchDecisions:
         mock_get_session.return_value = mock_session
 
         mock_query = mock_session.query.return_value
+        mock_query.join.return_value = mock_query
         mock_query.filter.return_value = mock_query
         mock_query.order_by.return_value = mock_query
         mock_query.limit.return_value = mock_query
@@ -320,8 +704,8 @@ class TestGetRecentSignals:
         mock_signal.signal_type = "position_limit_breach"
         mock_signal.source = "test_system"
         mock_signal.payload = {"asset": "BTC"}
-        mock_signal.timestamp = datetime(2025, 1, 15)
-        mock_signal.reliability = 0.95
+        mock_signal.observed_at = datetime(2025, 1, 15)
+        mock_signal.reliability = SignalReliability.HIGH
 
         mock_query = mock_session.query.return_value
         mock_query.filter.return_value = mock_query
@@ -334,6 +718,8 @@ class TestGetRecentSignals:
         assert len(result) == 1
         assert result[0]["id"] == "sig-001"
         assert result[0]["signal_type"] == "position_limit_breach"
+        assert result[0]["timestamp"] == "2025-01-15T00:00:00"
+        assert result[0]["reliability"] == "high"
 
     @patch('mcp_server.server.get_db_session')
     def test_get_recent_signals_with_filters(self, mock_get_session):
@@ -360,6 +746,61 @@ class TestGetRecentSignals:
         assert mock_query.filter.call_count >= 2
 
 
+    @patch('mcp_server.server.get_db_session')
+    def test_get_recent_signals_before_cursor_filters(self, mock_get_session):
+        """Test that a before cursor adds a keyset filter."""
+        from mcp_server.server import get_recent_signals
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        mock_query = mock_session.query.return_value
+        mock_query.filter.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+        mock_query.limit.return_value = mock_query
+        mock_query.all.return_value = []
+
+        result = get_recent_signals(
+            before="2025-01-15T00:00:00|00000000-0000-0000-0000-000000000001"
+        )
+
+        assert result == []
+        assert mock_query.filter.call_count == 1
+
+    @patch('mcp_server.server.get_db_session')
+    def test_get_recent_signals_page_cursor(self, mock_get_session):
+        """Test that a full page returns the last row as next_cursor."""
+        from mcp_server.server import get_recent_signals_page
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        signals = []
+        for i in range(3):
+            sig = Mock()
+            sig.id = "00000000-0000-0000-0000-00000000000%d" % i
+            sig.signal_type = "position_limit_breach"
+            sig.source = "test_system"
+            sig.payload = {}
+            sig.observed_at = datetime(2025, 1, 15, 10 - i)
+            sig.reliability = SignalReliability.HIGH
+            signals.append(sig)
+
+        mock_query = mock_session.query.return_value
+        mock_query.filter.return_value = mock_query
+        mock_query.order_by.return_value = mock_query
+        mock_query.limit.return_value = mock_query
+        mock_query.all.return_value = signals
+
+        result = get_recent_signals_page(limit=2)
+
+        assert len(result["signals"]) == 2
+        mock_query.limit.assert_called_with(3)
+        assert result["next_cursor"] == (
+            "2025-01-15T09:00:00|00000000-0000-0000-0000-000000000001"
+        )
+
+
 class TestMCPServerSafety:
     """Tests for MCP server safety constraints."""
 
@@ -389,3 +830,134 @@ class TestMCPServerSafety:
         from mcp_server.server import mcp
 
         assert "read-only" in mcp.instructions.lower() or "read only" in mcp.instructions.lower()
+
+
+
+class TestLoadSignals:
+    """Tests for batched signal loading."""
+
+    def test_single_query_preserves_order(self):
+        """Signals are fetched with one query and returned in signal_ids order."""
+        from mcp_server.server import _load_signals
+
+        sig_a, sig_b = Mock(id="a"), Mock(id="b")
+        mock_session = MagicMock()
+        mock_session.query.return_value.filter.return_value.all.return_value = [sig_a, sig_b]
+
+        result = _load_signals(mock_session, ["b", "missing", "a"])
+
+        assert result == [sig_b, sig_a]
+        assert mock_session.query.call_count == 1
+
+
+class TestGetPolicyDetail:
+    """Tests for get_policy_detail tool."""
+
+    @patch('mcp_server.server.get_db_session')
+    def test_get_policy_detail_single_query(self, mock_get_session):
+        """Policy and current version come from one joined query."""
+        from mcp_server.server import get_policy_detail
+
+        mock_session = MagicMock()
+        mock_get_session.return_value = mock_session
+
+        from core.models import Policy
+
+        mock_policy = Mock(spec=Policy)
+        mock_policy.id = "policy-001"
+        mock_policy.current_version = None
+        mock_policy.created_at = datetime(2025, 1, 1)
+
+        mock_query = mock_session.query.return_value
+        mock_query.options.return_value = mock_query
+        mock_query.filter.return_value = mock_query
+        mock_query.first.return_value = mock_policy
+
+        result = get_policy_detail("policy-001")
+
+        assert mock_session.query.call_count == 1
+        assert mock_query.options.called
+        assert "error" not in result
+        assert result["is_active"] is False
+        assert "current_version" not in result
+
+
+class TestStrictLoading:
+    """Tests for opt-in raiseload strict loading."""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Loader options pass through unchanged when the flag is unset."""
+        from mcp_server.server import _strict_loading
+
+        monkeypatch.delenv("GOVERNANCE_STRICT_LOADING", raising=False)
+        sentinel = object()
+
+        assert _strict_loading(sentinel) == (sentinel,)
+
+    def test_appends_raiseload_when_enabled(self, monkeypatch):
+        """raiseload('*') is appended after the explicit loader options."""
+        from mcp_server.server import _strict_loading
+
+        monkeypatch.setenv("GOVERNANCE_STRICT_LOADING", "1")
+        sentinel = object()
+
+        options = _strict_loading(sentinel)
+
+        assert len(options) == 2
+        assert options[0] is sentinel
+        assert options[1].strategy == (("lazy", "raise"),)
+
+
+class TestGetDbSession:
+    """Tests for engine reuse across tool calls."""
+
+    def test_engine_created_once(self, monkeypatch):
+        """Repeated calls share one engine and session factory."""
+        import mcp_server.database as database
+
+        monkeypatch.setattr(database, "_ENGINE", None)
+        monkeypatch.setattr(database, "_SESSION_FACTORY", None)
+
+        with patch("mcp_server.database.create_engine") as mock_create_engine:
+            first = database.get_db_session()
+            second = database.get_db_session()
+
+        mock_create_engine.assert_called_once()
+        assert first is not second
+        first.close()
+        second.close()
+
+    def test_engine_uses_orjson(self, monkeypatch):
+        """JSON/JSONB columns are (de)serialized with orjson."""
+        import orjson
+        import mcp_server.database as database
+
+        monkeypatch.setattr(database, "_ENGINE", None)
+        monkeypatch.setattr(database, "_SESSION_FACTORY", None)
+
+        with patch("mcp_server.database.create_engine") as mock_create_engine:
+            database.get_db_session().close()
+
+        kwargs = mock_create_engine.call_args.kwargs
+        assert kwargs["json_serializer"] is database._json_serializer
+        assert kwargs["json_deserializer"] is orjson.loads
+        assert kwargs["insertmanyvalues_page_size"] == 1000
+
+    def test_read_and_write_tools_share_session_factory(self):
+        """Read and write tools borrow sessions from the same engine factory."""
+        import mcp_server.database as database
+        import mcp_server.server as server
+        import mcp_server.tools.write_tools as write_tools
+
+        assert server.get_db_session is database.get_db_session
+        assert write_tools.get_db_session is database.get_db_session
+
+    def test_json_serializer_matches_stdlib_output(self):
+        """Serialized payloads decode to the same value as stdlib json."""
+        import json
+        from mcp_server.database import _json_serializer
+
+        payload = {"asset": "BTC", "limits": [1, 2.5, None], "nested": {"ok": True}}
+
+        assert json.loads(_json_serializer(payload)) == payload
+        assert json.loads(_json_serializer({1: "a"})) == {"1": "a"}
@@ -0,0 +1,296 @@
+"""
+Tests for Treasury Pack - Corporate treasury domain configuration.
+"""
+
+import pytest
+
+
+class TestTreasuryFingerprintExtractors:
+    """Tests for treasury fingerprint key-dimension extraction."""
+
+    def test_known_type_extracts_declared_fields(self):
+        """Test that a known signal type extracts exactly its fields."""
+        from packs.treasury.fingerprint_extractors import extract_key_dimensions
+
+        dims = extract_key_dimensions("fx_exposure_breach", {
+            "currency_pair": "EUR/USD",
+            "direction": "long",
+            "exposure": 1000000,
+        })
+
+        assert dims == {"currency_pair": "EUR/USD", "direction": "long"}
+
+    def test_known_type_missing_field_is_none(self):
+        """Test that missing fields on known types map to None."""
+        from packs.treasury.fingerprint_extractors import extract_key_dimensions
+
+        assert extract_key_dimensions("settlement_failure", {}) == {"trade_id": None}
+
+    def test_unknown_type_uses_asset_if_present(self):
+        """Test the default extractor only includes asset when present."""
+        from packs.treasury.fingerprint_extractors import extract_key_dimensions
+
+        assert extract_key_dimensions("unknown", {"asset": "BTC", "x": 1}) == {"asset": "BTC"}
+        assert extract_key_dimensions("unknown", {"x": 1}) == {}
+
+    def test_fields_reference_known_signal_types(self):
+        """Test that declared key fields only reference treasury signal types."""
+        from packs.treasury.signal_types import TREASURY_SIGNAL_TYPES
+        from packs.treasury.fingerprint_extractors import FIELDS
+
+        assert set(FIELDS) <= set(TREASURY_SIGNAL_TYPES)
+
+    def test_generated_extractors_follow_fields(self):
+        """Test that each generated extractor projects exactly its FIELDS, in order."""
+        from packs.treasury.fingerprint_extractors import FIELDS, extract_key_dimensions
+
+        for signal_type, fields in FIELDS.items():
+            dims = extract_key_dimensions(signal_type, {field: field.upper() for field in fields})
+            assert list(dims.items()) == [(field, field.upper()) for field in fields]
+
+    def test_compile_projection_rejects_non_string_fields(self):
+        """Test that only string fields are embedded in generated code."""
+        from packs.projection import compile_projection
+
+        assert compile_projection(("a", "b'c"))({"b'c": 1}) == {"a": None, "b'c": 1}
+        with pytest.raises(TypeError):
+            compile_projection(("a", 1))
+
+    def test_fields_are_required_by_payload_schema(self):
+        """Test that key fields are schema-required, so validated payloads always carry them."""
+        from packs.treasury.signal_types import TREASURY_SIGNAL_TYPES
+        from packs.treasury.fingerprint_extractors import FIELDS
+
+        for signal_type, fields in FIELDS.items():
+            schema = TREASURY_SIGNAL_TYPES[signal_type]["payload_schema"]
+            assert set(fields) <= set(schema), signal_type
+
+
+class TestTreasuryTemplates:
+    """Tests for treasury template modules."""
+
+    def test_templates_are_read_only(self):
+        """Test that top-level template mappings reject mutation."""
+        from packs.treasury.narrative_templates import TREASURY_NARRATIVE_TEMPLATES
+        from packs.treasury.option_templates import TREASURY_OPTION_TEMPLATES
+        from packs.treasury.policy_templates import TREASURY_POLICY_TEMPLATES
+
+        for templates in (TREASURY_NARRATIVE_TEMPLATES, TREASURY_OPTION_TEMPLATES, TREASURY_POLICY_TEMPLATES):
+            with pytest.raises(TypeError):
+                templates["new"] = {}
+
+    def test_policy_conditions_are_tuples(self):
+        """Test that policy condition sequences are tuples, as in the wealth pack."""
+        import json
+        from packs.treasury.policy_templates import TREASURY_POLICY_TEMPLATES
+
+        for policy in TREASURY_POLICY_TEMPLATES.values():
+            conditions = policy["rule_definition"]["conditions"]
+            assert isinstance(conditions, tuple)
+            assert len(json.loads(json.dumps(policy["rule_definition"]))["conditions"]) == len(conditions)
+
+    def test_option_sequences_are_tuples(self):
+        """Test that option sets and implications are immutable tuples."""
+        from packs.treasury.option_templates import TREASURY_OPTION_TEMPLATES
+
+        for signal_type, options in TREASURY_OPTION_TEMPLATES.items():
+            assert isinstance(options, tuple), signal_type
+            for option in options:
+                assert isinstance(option["implications"], tuple)
+
+    def test_option_templates_serialize_to_json(self):
+        """Test that options still serialize for JSONB storage."""
+        import json
+        from packs.treasury.option_templates import TREASURY_OPTION_TEMPLATES
+
+        options = json.loads(json.dumps(list(TREASURY_OPTION_TEMPLATES["position_limit_breach"])))
+
+        assert options[0]["id"] == "approve_temporary_increase"
+        assert isinstance(options[0]["implications"], list)
+
+    def test_narrative_templates_build_on_first_access(self, monkeypatch):
+        """Test that narrative templates are built lazily and then cached."""
+        import packs.treasury.narrative_templates as module
+
+        monkeypatch.delitem(vars(module), "TREASURY_NARRATIVE_TEMPLATES", raising=False)
+        assert "TREASURY_NARRATIVE_TEMPLATES" not in vars(module)
+
+        templates = module.TREASURY_NARRATIVE_TEMPLATES
+
+        assert vars(module)["TREASURY_NARRATIVE_TEMPLATES"] is templates
+        assert module.TREASURY_NARRATIVE_TEMPLATES is templates
+
+    def test_unknown_module_attribute_raises(self):
+        """Test that the lazy __getattr__ only serves template names."""
+        import packs.treasury.option_templates as module
+
+        with pytest.raises(AttributeError):
+            module.NOT_A_TEMPLATE
+
+    @pytest.mark.parametrize("module_name", ["option_templates", "policy_templates"])
+    def test_template_literals_have_no_duplicate_keys(self, module_name):
+        """Test that no template key is defined twice (later copies silently win)."""
+        import ast
+        from pathlib import Path
+
+        source = Path(__file__).parents[2] / "packs" / "treasury" / f"{module_name}.py"
+        tree = ast.parse(source.read_text())
+
+        builders = [node for node in tree.body if isinstance(node, ast.FunctionDef) and node.name == f"_build_{module_name}"]
+        assert len(builders) == 1
+
+        table = next(node for node in ast.walk(builders[0]) if isinstance(node, ast.Dict))
+        keys = [key.value for key in table.keys]
+        assert len(keys) == len(set(keys))
+
+    def test_signal_types_are_read_only(self):
+        """Test that the signal type registry cannot be mutated."""
+        from packs.treasury.signal_types import TREASURY_SIGNAL_TYPES
+
+        with pytest.raises(TypeError):
+            TREASURY_SIGNAL_TYPES["new_signal"] = {}
+
+    def test_template_for_signal_type(self):
+        """Test signal type to memo template mapping, including the fallback."""
+        from coprocessor.schemas.narrative import MemoTemplate
+        from packs.treasury.narrative_templates import get_template_for_signal_type
+
+        assert get_template_for_signal_type("position_limit_breach") is MemoTemplate.TREASURY_POSITION
+        assert get_template_for_signal_type("cash_forecast_variance") is MemoTemplate.TREASURY_LIQUIDITY
+        assert get_template_for_signal_type("settlement_failure") is MemoTemplate.TREASURY_COUNTERPARTY
+        assert get_template_for_signal_type("unknown_signal") is MemoTemplate.DECISION_BRIEF
+
+    def test_signal_template_map_values_are_templates(self):
+        """Test that every mapped value names a MemoTemplate member."""
+        from coprocessor.schemas.narrative import MemoTemplate
+        from packs.treasury.narrative_templates import _SIGNAL_TO_TEMPLATE
+
+        values = {template.value for template in MemoTemplate}
+        assert set(_SIGNAL_TO_TEMPLATE.values()) <= values
+
+    def test_template_lookups_are_memoized(self):
+        """Test that repeated lookups are served from the cache."""
+        from coprocessor.schemas.narrative import MemoTemplate
+        from packs.treasury.narrative_templates import get_template_for_signal_type, get_treasury_template
+
+        get_treasury_template.cache_clear()
+        first = get_treasury_template(MemoTemplate.TREASURY_POSITION)
+        second = get_treasury_template(MemoTemplate.TREASURY_POSITION)
+
+        assert first is second
+        assert get_treasury_template.cache_info().hits == 1
+
+        get_template_for_signal_type.cache_clear()
+        get_template_for_signal_type("fx_exposure_breach")
+        get_template_for_signal_type("fx_exposure_breach")
+        assert get_template_for_signal_type.cache_info().hits == 1
+
+    def test_unknown_treasury_template_raises_every_time(self):
+        """Test that unknown template errors are not cached away."""
+        from coprocessor.schemas.narrative import MemoTemplate
+        from packs.treasury.narrative_templates import get_treasury_template
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                get_treasury_template(MemoTemplate.WEALTH_CLIENT)
+
+
+    def test_repeated_template_strings_are_interned(self):
+        """Test that equal strings across templates share one object."""
+        import sys
+        from packs.treasury.option_templates import TREASURY_OPTION_TEMPLATES
+        from packs.treasury.policy_templates import TREASURY_POLICY_TEMPLATES
+
+        costs = [
+            implication
+            for options in TREASURY_OPTION_TEMPLATES.values()
+            for option in options
+            for implication in option["implications"]
+            if implication == "Operational complexity"
+        ]
+        assert len(costs) > 1
+        assert all(implication is sys.intern("Operational complexity") for implication in costs)
+
+        condition = TREASURY_POLICY_TEMPLATES["position_limit_policy"]["rule_definition"]["conditions"][0]
+        assert condition["threshold"]["field"] is sys.intern("payload.current_position")
+
+    def test_intern_tree_preserves_structure(self):
+        """Test that interning keeps container types and non-str values."""
+        from packs.interning import intern_tree
+
+        tree = {"a b": ["x y", ("z w", 1)], "n": None, "f": 1.5}
+
+        assert intern_tree(tree) == tree
+        assert isinstance(intern_tree(tree)["a b"][1], tuple)
+
+    def test_intern_tree_handles_str_subclass_keys(self):
+        """Test that str-subclass keys (e.g. str enums) are kept, not interned."""
+        from coprocessor.schemas.narrative import MemoTemplate
+        from packs.interning import intern_tree
+
+        tree = {MemoTemplate.DECISION_BRIEF: ["x y"]}
+        result = intern_tree({"k": tree})
+
+        assert result == {"k": tree}
+
+
+class TestTreasuryPolicyValidation:
+    """Tests for build-time policy template validation."""
+
+    def test_malformed_condition_is_rejected(self):
+        """Test that a condition missing threshold keys fails validation."""
+        from packs.treasury.policy_templates import _validate_policy_templates
+
+        templates = {
+            "broken_policy": {
+                "rule_definition": {
+                    "type": "threshold_breach",
+                    "conditions": [{
+                        "signal_type": "covenant_breach",
+                        "threshold": {"field": "payload.actual_ratio"},
+                        "severity_mapping": {"default": "high"},
+                    }],
+                },
+            },
+        }
+
+        with pytest.raises(ValueError, match="broken_policy"):
+            _validate_policy_templates(templates)
+
+    def test_missing_default_severity_is_rejected(self):
+        """Test that severity mappings must define a default."""
+        from packs.treasury.policy_templates import _build_policy_templates, _validate_policy_templates
+
+        templates = {name: dict(template) for name, template in _build_policy_templates().items()}
+        condition = dict(templates["settlement_policy"]["rule_definition"]["conditions"][0])
+        condition["severity_mapping"] = {"amount_usd > 1000000": "critical"}
+        templates["settlement_policy"]["rule_definition"] = {"type": "threshold_breach", "conditions": [condition]}
+
+        with pytest.raises(ValueError, match="no default"):
+            _validate_policy_templates(templates)
+
+
+class TestTreasuryImportCost:
+    """Tests that treasury modules defer heavy imports."""
+
+    def test_import_does_not_load_narrative_schemas(self):
+        """Test that importing the template modules skips coprocessor schemas."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys\n"
+            "import packs.treasury.option_templates\n"
+            "import packs.treasury.policy_templates\n"
+            "import packs.treasury.narrative_templates\n"
+            "assert 'coprocessor.schemas.narrative' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parents[2],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -20,6 +20,11 @@ class TestWealthSignalTypes:
         """Test that all 8 signal types are defined."""
         assert len(signal_types) == 8
 
+    def test_signal_types_are_read_only(self, signal_types):
+        """Test that the shared registry cannot be mutated."""
+        with pytest.raises(TypeError):
+            signal_types["new_signal"] = {}
+
     def test_signal_types_have_required_fields(self, signal_types):
         """Test that each signal type has required fields."""
         required_fields = ["description", "payload_schema", "severity_default"]
@@ -100,6 +105,22 @@ class TestWealthPolicyTemplates:
         """Test that all 8 policies are defined."""
         assert len(policy_templates) == 8
 
+    def test_policy_templates_are_read_only(self, policy_templates):
+        """Test that the shared registry cannot be mutated."""
+        with pytest.raises(TypeError):
+            policy_templates["new_policy"] = {}
+
+        for policy in policy_templates.values():
+            assert isinstance(policy["rule_definition"]["conditions"], tuple)
+
+    def test_rule_definitions_are_json_serializable(self, policy_templates):
+        """Test that rule definitions can still be stored as JSON."""
+        import json
+
+        for policy in policy_templates.values():
+            stored = json.loads(json.dumps(policy["rule_definition"]))
+            assert len(stored["conditions"]) == len(policy["rule_definition"]["conditions"])
+
     def test_policy_templates_have_required_fields(self, policy_templates):
         """Test that each policy has required fields."""
         required_fields = ["name", "description", "rule_definition"]
@@ -174,6 +195,23 @@ class TestWealthOptionTemplates:
         """Test that options are defined for all signal types."""
         assert len(option_templates) == 8
 
+    def test_option_templates_are_read_only(self, option_templates):
+        """Test that the shared registry cannot be mutated."""
+        with pytest.raises(TypeError):
+            option_templates["portfolio_drift"] = []
+
+    def test_option_templates_are_interned_tuples(self, option_templates):
+        """Test that option sequences and implications are tuples of interned strings."""
+        import sys
+
+        for options in option_templates.values():
+            assert isinstance(options, tuple)
+            for option in options:
+                assert isinstance(option["implications"], tuple)
+                assert all(item is sys.intern(item) for item in option["implications"])
+                assert option["label"] is sys.intern(option["label"])
+                assert option["description"] is sys.intern(option["description"])
+
     def test_option_templates_have_multiple_options(self, option_templates):
         """Test that each signal type has multiple symmetric options."""
         for sig_type, options in option_templates.items():
@@ -303,6 +341,92 @@ class TestWealthScenarios:
                 f"Scenario {scenario['id']} narrative too short"
 
 
+class TestWealthFingerprintExtractors:
+    """Tests for wealth fingerprint key-dimension extraction."""
+
+    def test_known_type_extracts_declared_fields(self):
+        """Test that a known signal type extracts exactly its fields."""
+        from packs.wealth.fingerprint_extractors import extract_key_dimensions
+
+        dims = extract_key_dimensions("portfolio_drift", {
+            "client_id": "C1",
+            "portfolio_id": "P1",
+            "asset_class": "equity",
+            "drift_percent": 7.5,
+        })
+
+        assert dims == {"client_id": "C1", "portfolio_id": "P1", "asset_class": "equity"}
+
+    def test_known_type_missing_field_is_none(self):
+        """Test that missing fields on known types map to None."""
+        from packs.wealth.fingerprint_extractors import extract_key_dimensions
+
+        dims = extract_key_dimensions("rebalancing_required", {"client_id": "C1"})
+
+        assert dims == {"client_id": "C1", "portfolio_id": None}
+
+    def test_unknown_type_uses_present_default_fields(self):
+        """Test that unknown types only include default fields that are present."""
+        from packs.wealth.fingerprint_extractors import extract_key_dimensions
+
+        assert extract_key_dimensions("unknown", {"client_id": "C1", "x": 1}) == {"client_id": "C1"}
+        assert extract_key_dimensions("unknown", {}) == {}
+
+    def test_results_are_independent_dicts(self):
+        """Test that each call returns a fresh dict callers may extend."""
+        from packs.wealth.fingerprint_extractors import extract_key_dimensions
+
+        payload = {"client_id": "C1", "portfolio_id": "P1", "asset_class": "equity"}
+        first = extract_key_dimensions("portfolio_drift", payload)
+        first["signal_type"] = "portfolio_drift"
+
+        assert extract_key_dimensions("portfolio_drift", payload) == {
+            "client_id": "C1", "portfolio_id": "P1", "asset_class": "equity",
+        }
+
+    def test_fields_cover_all_signal_types(self):
+        """Test that every wealth signal type has declared key fields."""
+        from packs.wealth.signal_types import WEALTH_SIGNAL_TYPES
+        from packs.wealth.fingerprint_extractors import FIELDS
+
+        assert set(FIELDS) == set(WEALTH_SIGNAL_TYPES)
+
+    def test_signal_type_keys_are_interned(self):
+        """Test that dispatch keys are interned, so interned callers hit the identity path."""
+        import sys
+        from packs.wealth.fingerprint_extractors import FIELDS
+
+        assert all(signal_type is sys.intern(signal_type) for signal_type in FIELDS)
+
+    def test_fields_are_required_by_payload_schema(self):
+        """Test that key fields are schema-required, so validated payloads always carry them."""
+        from packs.wealth.signal_types import WEALTH_SIGNAL_TYPES
+        from packs.wealth.fingerprint_extractors import FIELDS
+
+        for signal_type, fields in FIELDS.items():
+            schema = WEALTH_SIGNAL_TYPES[signal_type]["payload_schema"]
+            assert set(fields) <= set(schema), signal_type
+
+
+class TestWealthNarrativeTemplates:
+    """Tests for wealth narrative template routing."""
+
+    def test_template_for_signal_type(self):
+        """Test signal type to memo template mapping, including the fallback."""
+        from coprocessor.schemas.narrative import MemoTemplate
+        from packs.wealth.narrative_templates import get_template_for_signal_type
+
+        assert get_template_for_signal_type("suitability_mismatch") is MemoTemplate.WEALTH_SUITABILITY
+        assert get_template_for_signal_type("fee_schedule_change") is MemoTemplate.WEALTH_CLIENT
+        assert get_template_for_signal_type("unknown_signal") is MemoTemplate.DECISION_BRIEF
+
+    def test_every_signal_type_is_routed(self):
+        """Test that every wealth signal type has a template mapping."""
+        from packs.wealth.narrative_templates import _SIGNAL_TO_TEMPLATE
+        from packs.wealth.signal_types import WEALTH_SIGNAL_TYPES
+
+        assert set(_SIGNAL_TO_TEMPLATE) == set(WEALTH_SIGNAL_TYPES)
+
 class TestWealthPackModule:
     """Tests for wealth pack module imports."""
 
@@ -318,6 +442,27 @@ class TestWealthPackModule:
         assert WEALTH_POLICY_TEMPLATES is not None
         assert WEALTH_OPTION_TEMPLATES is not None
 
+    def test_package_imports_registries_lazily(self):
+        """Test that accessing one registry imports only its submodule."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from packs.wealth import WEALTH_SIGNAL_TYPES\n"
+            "assert 'packs.wealth.signal_types' in sys.modules\n"
+            "assert 'packs.wealth.policy_templates' not in sys.modules\n"
+            "assert 'packs.wealth.option_templates' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parents[2],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+
     def test_signal_policy_alignment(self):
         """Test that policies reference valid signal types."""
         from packs.wealth.signal_types import WEALTH_SIGNAL_TYPES
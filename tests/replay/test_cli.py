@@ -0,0 +1,219 @@
+"""
+Tests for Replay CLI - Loading and comparing replay output files.
+"""
+
+import json
+import os
+from argparse import Namespace
+
+import pytest
+
+from replay.cli import _load_replay, cmd_compare, cmd_ingest, cmd_run, load_replay
+
+
+def _write_replay(path, pass_count, fail_count):
+    """Write a replay output file in the format produced by `run --output`."""
+    path.write_text(json.dumps({
+        "replay_id": "replay-1",
+        "namespace": "test",
+        "summary": {
+            "signals_processed": pass_count + fail_count,
+            "evaluations": pass_count + fail_count,
+            "exceptions": fail_count,
+            "pass_count": pass_count,
+            "fail_count": fail_count,
+        },
+        "exceptions": [],
+    }))
+
+
+class TestLoadReplay:
+    """Tests for the cached replay file loader."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start each test with an empty loader cache."""
+        _load_replay.cache_clear()
+        yield
+        _load_replay.cache_clear()
+
+    def test_repeated_loads_are_cached(self, tmp_path):
+        """Test that loading an unchanged file reuses the parsed result."""
+        path = tmp_path / "baseline.json"
+        _write_replay(path, pass_count=3, fail_count=1)
+
+        first = load_replay(path)
+        second = load_replay(path)
+
+        assert first is second
+        assert first["summary"]["fail_count"] == 1
+        assert _load_replay.cache_info().hits == 1
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        """Test that a rewritten file is parsed again."""
+        path = tmp_path / "baseline.json"
+        _write_replay(path, pass_count=3, fail_count=1)
+        first = load_replay(path)
+
+        _write_replay(path, pass_count=2, fail_count=20)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_replay(path)["summary"]["fail_count"] == 20
+        assert first["summary"]["fail_count"] == 1
+
+
+class TestCmdCompare:
+    """Tests for the compare command."""
+
+    def test_compare_prints_summary_deltas(self, tmp_path, capsys):
+        """Test that summary counts are compared between files."""
+        baseline = tmp_path / "baseline.json"
+        comparison = tmp_path / "comparison.json"
+        _write_replay(baseline, pass_count=8, fail_count=2)
+        _write_replay(comparison, pass_count=5, fail_count=5)
+
+        code = cmd_compare(Namespace(baseline=str(baseline), comparison=str(comparison)))
+
+        out = capsys.readouterr().out
+        assert code == 0
+        assert "fail_count: 2 -> 5 (+3)" in out
+        assert "pass_count: 8 -> 5 (-3)" in out
+
+    def test_compare_missing_file(self, tmp_path):
+        """Test that a missing baseline file is an error."""
+        comparison = tmp_path / "comparison.json"
+        _write_replay(comparison, pass_count=1, fail_count=0)
+
+        code = cmd_compare(Namespace(baseline=str(tmp_path / "missing.json"), comparison=str(comparison)))
+
+        assert code == 1
+
+    def test_compare_invalid_json(self, tmp_path, capsys):
+        """Test that an unparseable file is an error."""
+        baseline = tmp_path / "baseline.json"
+        comparison = tmp_path / "comparison.json"
+        baseline.write_text("{not json")
+        _write_replay(comparison, pass_count=1, fail_count=0)
+
+        code = cmd_compare(Namespace(baseline=str(baseline), comparison=str(comparison)))
+
+        assert code == 1
+        assert "Invalid replay result file" in capsys.readouterr().out
+
+
+class TestCmdIngest:
+    """Tests for ingest command output files."""
+
+    def _args(self, csv_path, output):
+        """Build ingest arguments with default column mapping."""
+        return Namespace(
+            file=str(csv_path),
+            pack="treasury",
+            signal_type_col=None,
+            timestamp_col=None,
+            source_col=None,
+            mapping=None,
+            skip_errors=False,
+            verbose=False,
+            output=str(output),
+        )
+
+    def test_json_output(self, sample_csv_file, tmp_path):
+        """Test that JSON output holds batch metadata and all signals."""
+        output = tmp_path / "batch.json"
+
+        assert cmd_ingest(self._args(sample_csv_file, output)) == 0
+
+        data = json.loads(output.read_text())
+        assert data["row_count"] == len(data["signals"]) > 0
+        assert output.read_text().startswith('{\n  "batch_id"')
+
+    def test_ndjson_output(self, sample_csv_file, tmp_path):
+        """Test that .ndjson output writes one signal per line."""
+        json_output = tmp_path / "batch.json"
+        ndjson_output = tmp_path / "batch.ndjson"
+        cmd_ingest(self._args(sample_csv_file, json_output))
+
+        assert cmd_ingest(self._args(sample_csv_file, ndjson_output)) == 0
+
+        lines = ndjson_output.read_text().splitlines()
+        signals = [json.loads(line) for line in lines]
+        expected = json.loads(json_output.read_text())["signals"]
+        assert [s["signal_type"] for s in signals] == [s["signal_type"] for s in expected]
+        assert [s["payload"] for s in signals] == [s["payload"] for s in expected]
+
+
+class TestCliImports:
+    """Tests for CLI import cost."""
+
+    def test_cli_import_is_lazy(self):
+        """Test that importing the CLI does not load the replay engine modules."""
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        code = (
+            "import sys\n"
+            "import replay.cli\n"
+            "for name in ('replay.csv_ingestor', 'replay.harness', 'replay.comparison', 'replay.metrics'):\n"
+            "    assert name not in sys.modules, name\n"
+            "import replay\n"
+            "assert replay.ReplayHarness.__module__ == 'replay.harness'\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).parents[2],
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
+
+
+class TestCmdRun:
+    """Tests for the run command with sample data."""
+
+    def _args(self, **overrides):
+        """Build run arguments for the sample-data path."""
+        args = dict(
+            pack="treasury",
+            namespace="test_run",
+            from_date=None,
+            to_date=None,
+            db=False,
+            output=None,
+            verbose=False,
+        )
+        args.update(overrides)
+        return Namespace(**args)
+
+    def test_metrics_only_computed_when_verbose(self, monkeypatch, capsys):
+        """Test that metrics are skipped unless --verbose is given."""
+        from replay import metrics
+
+        calls = []
+        original = metrics.MetricsCalculator.calculate
+
+        def counting_calculate(self, result):
+            calls.append(result)
+            return original(self, result)
+
+        monkeypatch.setattr(metrics.MetricsCalculator, "calculate", counting_calculate)
+
+        assert cmd_run(self._args()) == 0
+        assert calls == []
+
+        assert cmd_run(self._args(verbose=True)) == 0
+        assert len(calls) == 1
+        assert "Replay complete!" in capsys.readouterr().out
+
+    def test_output_round_trips_through_compare_loader(self, tmp_path):
+        """Test that run output can be read back by load_replay."""
+        output = tmp_path / "run.json"
+
+        assert cmd_run(self._args(output=str(output))) == 0
+
+        data = load_replay(output)
+        assert data["namespace"] == "test_run"
+        assert data["summary"]["evaluations"] == data["summary"]["pass_count"] + data["summary"]["fail_count"]
@@ -4,12 +4,17 @@ Tests for Replay Comparison - Compare replay results.
 
 import pytest
 from datetime import datetime
+from types import SimpleNamespace
+from uuid import uuid4
 
 from replay.comparison import (
     compare_evaluations,
+    compare_with_production,
     ComparisonResult,
     EvaluationDiff,
     generate_comparison_report,
+    _convert_production_rows,
+    _signal_uuids,
 )
 from replay.harness import ReplayResult, EvaluationResult, ExceptionRaised
 
@@ -208,6 +213,185 @@ class TestCompareEvaluations:
         assert comparison.baseline_only == 1
         assert comparison.comparison_only == 0
 
+    def test_comparison_only_evaluations(self, baseline_result, matching_comparison):
+        """Test detection of comparison-only evaluations."""
+        matching_comparison.evaluations.append(EvaluationResult(
+            evaluation_id="eval_007",
+            policy_id="policy-002",
+            policy_version_id="version-002",
+            signal_id="signal-001",
+            result="pass",
+            input_hash="hash_001",
+        ))
+
+        comparison = compare_evaluations(baseline_result, matching_comparison)
+
+        assert comparison.total_evaluations == 3
+        assert comparison.matching_evaluations == 2
+        assert comparison.baseline_only == 0
+        assert comparison.comparison_only == 1
+
+    def test_duplicate_keys_use_last_evaluation(self, baseline_result, matching_comparison):
+        """Test that a repeated (signal, policy) pair is counted once, using the latest evaluation."""
+        stale = baseline_result.evaluations[0].model_copy(update={"result": "fail"})
+        baseline_result.evaluations.insert(0, stale)
+
+        comparison = compare_evaluations(baseline_result, matching_comparison)
+
+        assert comparison.total_evaluations == 2
+        assert comparison.matching_evaluations == 2
+        assert comparison.baseline_only == 0
+
+    def test_diffs_follow_comparison_order(self, baseline_result, divergent_comparison):
+        """Test that diffs are reported in the comparison run's order."""
+        divergent_comparison.evaluations.reverse()
+
+        comparison = compare_evaluations(baseline_result, divergent_comparison)
+
+        assert [d.signal_id for d in comparison.diffs] == ["signal-002", "signal-001"]
+
+    def test_counts_only_without_diffs(self, baseline_result, divergent_comparison):
+        """Test that collect_diffs=False keeps the counts but builds no diffs."""
+        comparison = compare_evaluations(
+            baseline_result,
+            divergent_comparison,
+            collect_diffs=False
+        )
+
+        assert comparison.divergent_evaluations == 2
+        assert comparison.diffs == []
+        assert comparison.is_deterministic is False
+        assert len(comparison.determinism_failures) == 1
+
+    def test_determinism_failures_are_capped(self):
+        """Test that failure messages beyond the first five are only counted."""
+        def run(replay_id, result):
+            run_result = ReplayResult(replay_id=replay_id, namespace="replay")
+            run_result.evaluations = [
+                EvaluationResult(
+                    evaluation_id=f"{replay_id}_{i}",
+                    policy_id="policy-001",
+                    policy_version_id="version-001",
+                    signal_id=f"signal-{i}",
+                    result=result,
+                    input_hash=f"hash_{i}",
+                )
+                for i in range(8)
+            ]
+            return run_result
+
+        comparison = compare_evaluations(run("baseline", "pass"), run("comparison", "fail"))
+
+        assert comparison.divergent_evaluations == 8
+        assert len(comparison.determinism_failures) == 5
+        assert comparison.determinism_failures_omitted == 3
+        assert "... and 3 more" in generate_comparison_report(comparison)
+
+
+class TestConvertProductionRows:
+    """Tests for converting production database rows to replay models."""
+
+    @pytest.fixture
+    def evaluation(self):
+        """Create the evaluation columns of a production row covering two signals."""
+        from core.models import EvaluationResult as DBEvaluationResult
+
+        return dict(
+            evaluation_id=uuid4(),
+            policy_version_id=uuid4(),
+            signal_ids=[uuid4(), uuid4()],
+            result=DBEvaluationResult.FAIL,
+            details={"rule": "limit"},
+            input_hash="hash_001",
+            evaluated_at=datetime(2025, 1, 15),
+            policy_id=uuid4(),
+        )
+
+    def _row(self, evaluation, severity=None, fingerprint=None):
+        """Build a production row, joined to an exception when severity is given."""
+        from core.models import ExceptionSeverity
+
+        return SimpleNamespace(
+            **evaluation,
+            exception_id=uuid4() if severity else None,
+            title="Limit breach" if severity else None,
+            severity=ExceptionSeverity(severity) if severity else None,
+            context={} if severity else None,
+            fingerprint=fingerprint,
+        )
+
+    def test_rows_expand_to_replayed_signals(self, evaluation):
+        """Test that each production evaluation yields one result per replayed signal."""
+        replayed = str(evaluation["signal_ids"][0])
+
+        evaluations, exceptions = _convert_production_rows([self._row(evaluation)], {replayed})
+
+        assert len(evaluations) == 1
+        assert evaluations[0].signal_id == replayed
+        assert evaluations[0].policy_id == str(evaluation["policy_id"])
+        assert evaluations[0].evaluation_id == str(evaluation["evaluation_id"])
+        assert evaluations[0].result == "fail"
+        assert evaluations[0].severity is None
+        assert evaluations[0].details == {"rule": "limit"}
+        assert exceptions == []
+
+    def test_joined_exceptions(self, evaluation):
+        """Test that joined exceptions are collected and set the evaluation severity."""
+        replayed = str(evaluation["signal_ids"][0])
+        rows = [
+            self._row(evaluation, "high", "fp_001"),
+            self._row(evaluation, "low", "fp_002"),
+        ]
+
+        evaluations, exceptions = _convert_production_rows(rows, {replayed})
+
+        assert len(evaluations) == 1
+        assert evaluations[0].severity == "high"
+        assert [e.fingerprint for e in exceptions] == ["fp_001", "fp_002"]
+        assert exceptions[0].evaluation_id == str(evaluation["evaluation_id"])
+        assert exceptions[0].signal_ids == [str(s) for s in evaluation["signal_ids"]]
+
+    def test_production_exceptions_are_compared(self, evaluation):
+        """Test that converted exceptions feed the fingerprint comparison."""
+        replayed = str(evaluation["signal_ids"][0])
+        production = ReplayResult(replay_id="production", namespace="production")
+        production.evaluations, production.exceptions_raised = _convert_production_rows(
+            [self._row(evaluation, "high", "fp_001")], {replayed}
+        )
+        replay = ReplayResult(replay_id="replay", namespace="replay")
+        replay.evaluations = [production.evaluations[0].model_copy()]
+
+        comparison = compare_evaluations(production, replay)
+
+        assert comparison.baseline_exception_count == 1
+        assert comparison.resolved_exceptions == 1
+        assert comparison.matching_evaluations == 1
+
+    def test_compare_with_production_streams_needed_columns(self):
+        """Test that production rows are streamed with only the converted columns."""
+        statements = []
+
+        class RecordingSession:
+            def execute(self, stmt):
+                statements.append(stmt)
+                return iter([])
+
+        replay = ReplayResult(replay_id="replay", namespace="replay")
+        comparison = compare_with_production(replay, RecordingSession())
+
+        stmt = statements[0]
+        columns = {c.name for c in stmt.selected_columns}
+        assert stmt.get_execution_options()["yield_per"] == 1000
+        assert {"evaluation_id", "exception_id", "signal_ids", "fingerprint"} <= columns
+        assert "options" not in columns
+        assert comparison.total_evaluations == 0
+
+    def test_signal_uuids_skip_non_uuid_ids(self):
+        """Test that replay IDs which are not UUIDs are not sent to the database."""
+        signal_id = uuid4()
+
+        assert _signal_uuids({str(signal_id), "signal-001"}) == [signal_id]
+
 
 class TestComparisonResult:
     """Tests for ComparisonResult model."""
@@ -302,3 +486,4 @@ class TestGenerateComparisonReport:
 
         assert "NO" in report  # Is deterministic: NO
         assert "Failure 1" in report
+        assert "more" not in report
@@ -11,6 +11,8 @@ from replay.csv_ingestor import (
     ColumnMapping,
     IngestedSignal,
     ImportBatch,
+    compute_signal_content_hash,
+    compute_signal_content_hashes,
 )
 
 
@@ -76,6 +78,40 @@ class TestIngestedSignal:
         assert signal.provenance["row_number"] == 5
 
 
+class TestContentHash:
+    """Tests for signal content hashing."""
+
+    def test_batch_hashes_match_single_hash(self):
+        """Test that batch hashing produces the same hashes as the per-signal function."""
+        signals = [
+            IngestedSignal(
+                signal_type="position_limit_breach",
+                source="trading_desk",
+                payload={"limit": 100, "asset": "BTC", "nested": {"b": 1, "a": [1.5, None]}},
+                timestamp=datetime(2025, 1, 15, 10, 30),
+            ),
+            IngestedSignal(
+                signal_type="position_limit_breach",
+                source="caf\u00e9 \"desk\"",
+                payload={"when": datetime(2025, 1, 1), "note": "\u2713"},
+                timestamp=datetime(2025, 1, 16),
+            ),
+        ]
+
+        expected = [
+            compute_signal_content_hash(
+                pack="treasury",
+                signal_type=s.signal_type,
+                payload=s.payload,
+                source=s.source,
+                observed_at=s.timestamp,
+            )
+            for s in signals
+        ]
+
+        assert compute_signal_content_hashes("treasury", signals) == expected
+
+
 class TestCSVIngestor:
     """Tests for CSVIngestor class."""
 
@@ -96,6 +132,48 @@ class TestCSVIngestor:
         # US format
         assert ingestor._parse_timestamp("01/15/2025") == datetime(2025, 1, 15)
 
+    @pytest.mark.parametrize("value,expected", [
+        ("2025-01-15T10:30:45Z", datetime(2025, 1, 15, 10, 30, 45)),
+        (" 2025-01-15 ", datetime(2025, 1, 15)),
+        ("2025-1-5", datetime(2025, 1, 5)),  # Not zero-padded: strptime fallback
+        ("2025-01-15 9:05:00", datetime(2025, 1, 15, 9, 5)),
+        ("01/15/2025 10:30:45", datetime(2025, 1, 15, 10, 30, 45)),
+        ("1/5/2025", datetime(2025, 1, 5)),
+    ])
+    def test_parse_timestamp_iso_fast_path_and_fallback(self, value, expected):
+        """Test that the sliced ISO parser and the strptime fallback agree."""
+        ingestor = CSVIngestor()
+
+        assert ingestor._parse_timestamp(value) == expected
+
+    def test_parse_timestamp_caches_strptime_fallback(self):
+        """Test that repeated non-ISO timestamps are parsed once."""
+        from replay.csv_ingestor import _parse_timestamp_formats
+
+        ingestor = CSVIngestor()
+        _parse_timestamp_formats.cache_clear()
+
+        first = ingestor._parse_timestamp("03/31/2025")
+        second = ingestor._parse_timestamp(" 03/31/2025 ")
+
+        assert first == second == datetime(2025, 3, 31)
+        assert _parse_timestamp_formats.cache_info().hits == 1
+
+    @pytest.mark.parametrize("value", [
+        "2025-02-30",
+        "2025-13-01 00:00:00",
+        "2025-01-15 10:00:00Z",  # "Z" only follows the "T" separator
+        "2025-01-15T24:00:00",
+        "2025/01/15",
+        "01-15-2025",
+    ])
+    def test_parse_timestamp_rejects_invalid_iso(self, value):
+        """Test that ISO-shaped but invalid timestamps are still rejected."""
+        ingestor = CSVIngestor()
+
+        with pytest.raises(ValueError, match="Unable to parse timestamp"):
+            ingestor._parse_timestamp(value)
+
     def test_parse_timestamp_invalid(self):
         """Test parsing invalid timestamp raises error."""
         ingestor = CSVIngestor()
@@ -124,6 +202,26 @@ class TestCSVIngestor:
         assert ingestor._parse_value("") is None
         assert ingestor._parse_value("   ") is None
 
+    @pytest.mark.parametrize("value,expected", [
+        ("007", 7),
+        ("-5", -5),
+        ("1_000", 1000),
+        ("Infinity", float("inf")),
+        ("-inf", float("-inf")),
+        ("1e3", 1000.0),
+        ("e5", "e5"),
+        ("infx", "infx"),
+        ("\u00b2", "\u00b2"),  # isdigit() but not a decimal int() accepts
+    ])
+    def test_parse_value_edge_cases(self, value, expected):
+        """Test that the no-exception shortcuts match int()/float() parsing."""
+        ingestor = CSVIngestor()
+
+        parsed = ingestor._parse_value(value)
+
+        assert parsed == expected
+        assert type(parsed) is type(expected)
+
     def test_ingest_csv_file(self, sample_csv_file):
         """Test ingesting a CSV file."""
         ingestor = CSVIngestor(pack="treasury")
@@ -146,6 +244,17 @@ class TestCSVIngestor:
         assert batch.file_hash is not None
         assert batch.source_file == str(sample_csv_file.absolute())
 
+    def test_ingest_interns_signal_type_and_source(self, sample_csv_file):
+        """Test that repeated signal types and sources share one string object."""
+        import sys
+
+        ingestor = CSVIngestor(pack="treasury")
+        batch = ingestor.ingest(sample_csv_file, ColumnMapping(signal_type="signal_type"))
+
+        for signal in batch.signals:
+            assert signal.signal_type is sys.intern(signal.signal_type)
+            assert signal.source is sys.intern(signal.source)
+
     def test_ingest_provenance_tracking(self, sample_csv_file):
         """Test that provenance is properly tracked."""
         ingestor = CSVIngestor()
@@ -213,3 +322,83 @@ test,2025-01-15,extra_value,123
 
         assert signal.payload["extra_field"] == "extra_value"
         assert signal.payload["another_field"] == 123
+
+
+class TestIngestToDb:
+    """Tests for persisting ingested signals."""
+
+    class RecordingSession:
+        """Session stand-in that records the insert and reports existing hashes as conflicts."""
+
+        def __init__(self, existing=()):
+            self.existing = set(existing)
+            self.inserts = []
+            self.committed = False
+
+        def scalars(self, stmt, rows):
+            self.inserts.append((stmt, rows))
+            return [r["content_hash"] for r in rows if r["content_hash"] not in self.existing]
+
+        def commit(self):
+            self.committed = True
+
+    def _csv(self, tmp_path, rows):
+        """Write a CSV with the given (signal_type, timestamp) rows."""
+        csv_path = tmp_path / "signals.csv"
+        csv_path.write_text(
+            "signal_type,timestamp,amount\n"
+            + "".join(f"{t},{ts},100\n" for t, ts in rows)
+        )
+        return csv_path
+
+    def test_signals_inserted_in_one_statement(self, sample_csv_file):
+        """Test that all signals are inserted with a single ON CONFLICT statement."""
+        from sqlalchemy.dialects import postgresql
+
+        session = self.RecordingSession()
+        batch = CSVIngestor(pack="treasury").ingest_to_db(
+            sample_csv_file, ColumnMapping(signal_type="signal_type"), session
+        )
+
+        assert len(session.inserts) == 1
+        stmt, rows = session.inserts[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (content_hash) DO NOTHING" in sql
+        assert [r["content_hash"] for r in rows] == [s.content_hash for s in batch.signals]
+        assert batch.signals_created == 3
+        assert batch.signals_deduplicated == 0
+        assert session.committed
+
+    def test_existing_and_repeated_signals_are_deduplicated(self, tmp_path):
+        """Test that signals already stored or repeated in the file are counted as duplicates."""
+        csv_path = self._csv(tmp_path, [
+            ("deposit", "2025-01-15"),
+            ("deposit", "2025-01-15"),
+            ("deposit", "2025-01-16"),
+        ])
+        ingestor = CSVIngestor(pack="treasury")
+        mapping = ColumnMapping(signal_type="signal_type")
+        stored = ingestor.ingest_to_db(csv_path, mapping, self.RecordingSession()).signals[2]
+
+        session = self.RecordingSession(existing={stored.content_hash})
+        batch = ingestor.ingest_to_db(csv_path, mapping, session)
+
+        assert len(session.inserts[0][1]) == 2  # Repeated row is not sent
+        assert batch.signals_created == 1
+        assert batch.signals_deduplicated == 2
+
+    def test_duplicates_raise_when_not_skipped(self, tmp_path):
+        """Test that skip_duplicates=False reports the first duplicate without committing."""
+        csv_path = self._csv(tmp_path, [
+            ("deposit", "2025-01-15"),
+            ("withdrawal", "2025-01-16"),
+            ("withdrawal", "2025-01-16"),
+        ])
+        session = self.RecordingSession()
+
+        with pytest.raises(ValueError, match="Duplicate signal detected: withdrawal"):
+            CSVIngestor(pack="treasury").ingest_to_db(
+                csv_path, ColumnMapping(signal_type="signal_type"), session, skip_duplicates=False
+            )
+
+        assert not session.committed
@@ -79,6 +79,44 @@ class TestReplayHarness:
         assert hash1 == hash2
         assert len(hash1) == 64  # SHA256
 
+    @pytest.mark.parametrize("policy_version,signal", [
+        (
+            {"id": "v1", "rule_definition": {"type": "threshold_breach", "conditions": ({"b": 1, "a": "é"},)}},
+            {"signal_type": "t", "payload": {"z": 1, "a": datetime(2025, 1, 1)}, "timestamp": datetime(2025, 1, 15, 10)},
+        ),
+        (
+            {"rule_definition": None},
+            {"signal_type": None, "payload": {"nested": {"y": [1, 2.5], "x": None}}, "timestamp": "2025-01-15"},
+        ),
+    ])
+    def test_input_hash_matches_canonical_json(self, harness, policy_version, signal):
+        """Test that the split hash equals hashing the whole canonical document."""
+        import hashlib
+        import json
+
+        timestamp = signal.get("timestamp")
+        canonical = json.dumps({
+            "policy_version_id": policy_version.get("id"),
+            "rule_definition": policy_version.get("rule_definition"),
+            "signal_type": signal.get("signal_type"),
+            "signal_payload": signal.get("payload"),
+            "signal_timestamp": timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp,
+        }, sort_keys=True, default=str)
+
+        expected = hashlib.sha256(canonical.encode()).hexdigest()
+        assert harness._compute_input_hash(policy_version, signal) == expected
+
+    def test_run_input_hashes_match_per_evaluation_hash(self, harness, ingested_signals, sample_policies):
+        """Test that hashes computed in run() match _compute_input_hash."""
+        result = harness.run(ingested_signals, sample_policies)
+
+        signals = {s.id: s for s in ingested_signals}
+        policies = {p["id"]: p for p in sample_policies}
+        for evaluation in result.evaluations:
+            policy_version = policies[evaluation.policy_id]["current_version"]
+            expected = harness._compute_input_hash(policy_version, signals[evaluation.signal_id].model_dump())
+            assert evaluation.input_hash == expected
+
     def test_compute_fingerprint_deterministic(self, harness):
         """Test that fingerprint is deterministic."""
         fp1 = harness._compute_fingerprint(
@@ -185,6 +223,121 @@ class TestReplayHarness:
         assert harness._get_nested_value(data, "level1.level2") == {"value": 42}
         assert harness._get_nested_value(data, "nonexistent") is None
 
+    def test_compiled_rule_cached_per_run(self, harness, ingested_signals, sample_policies):
+        """Test that each rule is compiled once and the cache is reset per run."""
+        rule = sample_policies[0]["current_version"]["rule_definition"]
+
+        compiled = harness._compile_rule(rule)
+        harness._compiled_rules[id(rule)] = (rule, compiled)
+        signal = ingested_signals[0]
+        harness._evaluate_threshold_breach(rule, signal)
+        assert harness._compiled_rules[id(rule)][1] is compiled
+
+        harness.run(ingested_signals, sample_policies)
+        assert harness._compiled_rules[id(rule)][1] is not compiled
+
+    def test_compiled_rule_groups_conditions_by_signal_type(self, harness):
+        """Test that only conditions for the signal's type are evaluated, in order."""
+        rule = {
+            "type": "threshold_breach",
+            "conditions": [
+                {
+                    "signal_type": "client_cash_withdrawal",
+                    "threshold": {"field": "payload.withdrawal_percent", "operator": ">", "value": 10},
+                    "severity_mapping": {"default": "medium"},
+                },
+                {
+                    "signal_type": "portfolio_drift",
+                    "threshold": {"field": "payload.drift_percent", "operator": ">", "value": 5},
+                    "severity_mapping": {"default": "high"},
+                },
+                {
+                    "signal_type": "client_cash_withdrawal",
+                    "threshold": {"field": "payload.details.amount_usd", "operator": ">=", "value": 100000},
+                    "severity_mapping": {"default": "critical"},
+                },
+            ],
+            "evaluation_logic": "all_conditions_met",
+        }
+        signal = IngestedSignal(
+            signal_type="client_cash_withdrawal",
+            source="test",
+            payload={"withdrawal_percent": 20, "details": {"amount_usd": 100000}},
+            timestamp=datetime.utcnow(),
+        )
+
+        result, severity, details = harness._evaluate_threshold_breach(rule, signal)
+
+        assert [r["condition"] for r in details["condition_results"]] == [
+            rule["conditions"][0],
+            rule["conditions"][2],
+        ]
+        assert [r["result"] for r in details["condition_results"]] == ["breached", "breached"]
+        assert severity == "critical"
+        # all_conditions_met still counts every condition in the rule
+        assert result == "pass"
+
+    def test_compiled_rule_interns_signal_types(self, harness):
+        """Test that compiled condition groups are keyed by interned signal types."""
+        import json
+        import sys
+
+        # Round-trip through JSON, as rules loaded from the database are
+        rule = json.loads(json.dumps({
+            "conditions": [{"signal_type": "portfolio_drift", "threshold": {"field": "payload.x"}}],
+        }))
+
+        compiled = harness._compile_rule(rule)
+
+        (signal_type,) = compiled.conditions_by_type
+        assert signal_type is sys.intern("portfolio_drift")
+
+    def test_compiled_condition_direct_key(self, harness):
+        """Test that only single-key field paths are read with a direct key."""
+        rule = {
+            "conditions": [
+                {"signal_type": "a", "threshold": {"field": "payload.drift_percent"}},
+                {"signal_type": "a", "threshold": {"field": "payload.details.amount_usd"}},
+            ],
+        }
+
+        flat, nested = harness._compile_rule(rule).conditions_by_type["a"]
+
+        assert flat.field_key == "drift_percent"
+        assert nested.field_key is None
+        assert nested.field_keys == ("details", "amount_usd")
+
+    def test_unmatched_signal_type(self, harness):
+        """Test evaluation of a signal no condition applies to."""
+        rule = {
+            "type": "threshold_breach",
+            "conditions": [
+                {
+                    "signal_type": "portfolio_drift",
+                    "threshold": {"field": "payload.drift_percent", "operator": ">", "value": 5},
+                }
+            ],
+        }
+        signal = IngestedSignal(
+            signal_type="fee_schedule_change",
+            source="test",
+            payload={"drift_percent": 50},
+            timestamp=datetime.utcnow(),
+        )
+
+        result, severity, details = harness._evaluate_threshold_breach(rule, signal)
+        assert (result, severity) == ("pass", None)
+        assert details == {"condition_results": [], "evaluation_logic": "any_condition_met"}
+
+        empty_rule = {"conditions": [], "evaluation_logic": "all_conditions_met"}
+        result, _, _ = harness._evaluate_threshold_breach(empty_rule, signal)
+        assert result == "fail"
+
+    def test_compare_unknown_operator_raises(self, harness):
+        """Test that an unknown operator raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown operator"):
+            harness._compare_values(1, "~", 2)
+
     def test_run_replay(self, harness, ingested_signals, sample_policies):
         """Test running a full replay."""
         config = ReplayConfig(namespace="test_replay")
@@ -248,6 +401,44 @@ class TestReplayHarness:
         # Fingerprints should dedupe to 1 exception
         # (depending on fingerprint implementation)
 
+    def test_unencodable_signal_recorded_as_error(self, harness, sample_policies):
+        """Test that a signal whose input cannot be hashed does not stop the run."""
+        good = IngestedSignal(
+            signal_type="position_limit_breach",
+            source="test",
+            payload={"current_position": 150, "limit": 100, "asset": "BTC"},
+            timestamp=datetime(2025, 1, 15, 10, 0, 0),
+        )
+        bad = IngestedSignal(
+            signal_type="position_limit_breach",
+            source="test",
+            payload={"n": {1: "a", "b": 2}},  # Mixed key types cannot be sorted
+            timestamp=datetime(2025, 1, 15, 10, 1, 0),
+        )
+
+        result = harness.run([bad, good], sample_policies[:1])
+
+        assert [e.signal_id for e in result.evaluations] == [good.id]
+        assert len(result.errors) == 1
+        assert result.errors[0]["signal_id"] == bad.id
+        assert result.errors[0]["policy_id"] == "policy-001"
+
+    def test_unencodable_policy_recorded_per_signal(self, harness, ingested_signals, sample_policies):
+        """Test that a policy whose input cannot be hashed is skipped with one error per signal."""
+        bad_policy = {
+            "id": "policy-bad",
+            "current_version": {
+                "id": "version-bad",
+                "rule_definition": {"type": "threshold_breach", "conditions": [], 1: "x"},
+            },
+        }
+
+        result = harness.run(ingested_signals, [bad_policy, sample_policies[0]])
+
+        assert len(result.evaluations) == len(ingested_signals)
+        assert all(e.policy_id == "policy-001" for e in result.evaluations)
+        assert [e["policy_id"] for e in result.errors] == ["policy-bad"] * len(ingested_signals)
+
     def test_replay_metrics(self, harness, ingested_signals, sample_policies):
         """Test that replay metrics are calculated correctly."""
         result = harness.run(ingested_signals, sample_policies)